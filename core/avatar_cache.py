@@ -2,39 +2,59 @@ from __future__ import annotations
 
 import asyncio
 import time
-from collections.abc import Iterable
+from collections.abc import Awaitable, Iterable
 
 from .http import HttpClient
 from .network_retry import get_with_retry
 
 try:
+    from ..utils.json_codec import response_json
     from ..utils.logger import logger
 except ImportError:
+    from utils.json_codec import response_json
     from utils.logger import logger
 
 
 NO_FACE = "http://i0.hdslb.com/bfs/face/member/noface.jpg"
 KV_KEY = "bili_avatar_cache"
 REFRESH_AFTER_SEC = 24 * 3600
+FAILED_RETRY_SEC = 300
 UNUSED_RETENTION_SEC = 120 * 24 * 3600
 FETCH_CONCURRENCY = 4
+LIVE_BATCH_SIZE = 50
 
 
 _cache: dict[str, dict] = {}
 _loaded = False
 _lock = asyncio.Lock()
 _fetch_semaphore = asyncio.Semaphore(FETCH_CONCURRENCY)
+_inflight: dict[str, asyncio.Task] = {}
 
 
-async def fetch_avatar_map(star, uids: Iterable[str]) -> dict[str, str]:
-    """Return UID -> face URL with a persistent KV cache and bounded fetch queue."""
+async def fetch_avatar_map(
+    star,
+    uids: Iterable[str],
+    known: dict[str, str] | None = None,
+    live_resolved: bool = False,
+) -> dict[str, str]:
+    """Return UID -> face URL with a persistent KV cache and bounded fetch queue.
+
+    ``known`` holds face URLs the caller already got from another batch API;
+    those UIDs are refreshed in the cache without a card request.
+    ``live_resolved`` skips the live-room batch lookup when the caller has
+    already queried it.
+    """
     uid_list = _normalize_uids(uids)
     if not uid_list:
         return {}
+    known = {str(uid): face for uid, face in (known or {}).items() if face}
 
     if star is None:
-        fetched = await _fetch_uncached(uid_list)
-        return {uid: fetched.get(uid) or NO_FACE for uid in uid_list}
+        missing = [uid for uid in uid_list if uid not in known]
+        fetched = await _fetch_uncached(missing, live_resolved) if missing else {}
+        return {
+            uid: known.get(uid) or fetched.get(uid) or NO_FACE for uid in uid_list
+        }
 
     now = time.time()
     await _ensure_loaded(star)
@@ -43,6 +63,10 @@ async def fetch_avatar_map(star, uids: Iterable[str]) -> dict[str, str]:
 
     async with _lock:
         for uid in uid_list:
+            if face := known.get(uid):
+                _cache[uid] = {"face": face, "fetched_at": now, "last_used_at": now}
+                result[uid] = face
+                continue
             entry = _cache_entry(uid)
             face = str(entry.get("face") or "")
             fetched_at = float(entry.get("fetched_at") or 0)
@@ -54,7 +78,7 @@ async def fetch_avatar_map(star, uids: Iterable[str]) -> dict[str, str]:
                 stale.append(uid)
 
     if stale:
-        fetched = await _fetch_uncached(stale)
+        fetched = await _fetch_uncached(stale, live_resolved)
         async with _lock:
             for uid in stale:
                 entry = _cache_entry(uid)
@@ -65,7 +89,10 @@ async def fetch_avatar_map(star, uids: Iterable[str]) -> dict[str, str]:
                     "fetched_at": (
                         now
                         if fetched.get(uid)
-                        else float(entry.get("fetched_at") or 0)
+                        else max(
+                            float(entry.get("fetched_at") or 0),
+                            now - REFRESH_AFTER_SEC + FAILED_RETRY_SEC,
+                        )
                     ),
                     "last_used_at": now,
                 }
@@ -74,6 +101,38 @@ async def fetch_avatar_map(star, uids: Iterable[str]) -> dict[str, str]:
     return {uid: result.get(uid, NO_FACE) for uid in uid_list}
 
 
+async def fetch_faces_with_live(
+    star,
+    uids: Iterable[str],
+    live_uids: Iterable[str],
+    live_infos: Awaitable[list],
+) -> tuple[list, dict[str, str]]:
+    """Return (live infos, UID -> face URL), overlapping avatars with the live batch.
+
+    UIDs outside ``live_uids`` are resolved while ``live_infos`` is pending;
+    live UIDs wait for it and reuse its ``face`` fields as known values.
+    """
+    uid_list = _normalize_uids(uids)
+    live_set = {str(uid) for uid in live_uids}
+    infos, face_map = await asyncio.gather(
+        live_infos,
+        fetch_avatar_map(
+            star,
+            [uid for uid in uid_list if uid not in live_set],
+            live_resolved=True,
+        ),
+    )
+    face_map.update(
+        await fetch_avatar_map(
+            star,
+            [uid for uid in uid_list if uid in live_set],
+            known={str(info.uid): info.face for info in infos},
+            live_resolved=True,
+        )
+    )
+    return infos, face_map
+
+
 async def _ensure_loaded(star) -> None:
     global _loaded, _cache
     if _loaded:
@@ -109,33 +168,84 @@ async def _cleanup_and_save(star) -> None:
         logger.warning(f"头像缓存保存失败: {exc}")
 
 
-async def _fetch_uncached(uids: list[str]) -> dict[str, str]:
+async def _fetch_uncached(
+    uids: list[str], live_resolved: bool = False
+) -> dict[str, str]:
+    pending = [uid for uid in uids if uid not in _inflight]
+    if pending:
+        task = asyncio.ensure_future(_fetch_group(pending, live_resolved))
+        for uid in pending:
+            _inflight[uid] = task
+        task.add_done_callback(
+            lambda done, pending=pending: [
+                _inflight.pop(uid, None)
+                for uid in pending
+                if _inflight.get(uid) is done
+            ]
+        )
+
+    tasks = list(dict.fromkeys(_inflight[uid] for uid in uids))
+    faces: dict[str, str] = {}
+    for fetched in await asyncio.gather(*(asyncio.shield(task) for task in tasks)):
+        faces.update(fetched)
+    return {uid: faces.get(uid, "") for uid in uids}
+
+
+async def _fetch_group(uids: list[str], live_resolved: bool) -> dict[str, str]:
     client = await HttpClient.get_client()
+    room_faces = {} if live_resolved else await _fetch_live_room_faces(client, uids)
+    fetched = await asyncio.gather(
+        *(_fetch_card_face(client, uid) for uid in uids if uid not in room_faces)
+    )
+    return {**room_faces, **dict(fetched)}
+
 
-    async def fetch(uid: str) -> tuple[str, str]:
+async def _fetch_card_face(client, uid: str) -> tuple[str, str]:
+    async with _fetch_semaphore:
+        face = ""
+        try:
+            res = await get_with_retry(
+                client,
+                "https://api.bilibili.com/x/web-interface/card",
+                label=f"获取头像 {uid}",
+                params={"mid": uid},
+                timeout=5,
+            )
+            if res.status_code == 200:
+                data = response_json(res)
+                if data.get("code") == 0:
+                    face = data.get("data", {}).get("card", {}).get("face") or NO_FACE
+        except Exception as exc:
+            logger.debug(f"获取头像失败 {uid}: {exc}")
+            return uid, ""
+        return uid, face
+
+
+async def _fetch_live_room_faces(client, uids: list[str]) -> dict[str, str]:
+    """Resolve faces of UIDs that own a live room with one batch request."""
+    faces: dict[str, str] = {}
+    for index in range(0, len(uids), LIVE_BATCH_SIZE):
+        batch = uids[index:index + LIVE_BATCH_SIZE]
         async with _fetch_semaphore:
-            face = ""
             try:
                 res = await get_with_retry(
                     client,
-                    "https://api.bilibili.com/x/web-interface/card",
-                    label=f"获取头像 {uid}",
-                    params={"mid": uid},
+                    "https://api.live.bilibili.com/room/v1/Room/get_status_info_by_uids",
+                    label=f"批量获取头像 {len(batch)} 个 UID",
+                    params={"uids[]": batch},
                     timeout=5,
                 )
-                if res.status_code == 200:
-                    data = res.json()
-                    if data.get("code") == 0:
-                        face = (
-                            data.get("data", {}).get("card", {}).get("face")
-                            or NO_FACE
-                        )
+                if res.status_code != 200:
+                    continue
+                data = response_json(res)
+                if data.get("code") != 0 or not isinstance(data.get("data"), dict):
+                    continue
+                for uid, info in data["data"].items():
+                    if isinstance(info, dict) and info.get("face"):
+                        faces[str(uid)] = str(info["face"])
             except Exception as exc:
-                logger.debug(f"获取头像失败 {uid}: {exc}")
-                return uid, ""
-            return uid, face
-
-    return dict(await asyncio.gather(*[fetch(uid) for uid in uids]))
+                logger.debug(f"批量获取头像失败: {exc}")
+    return faces
 
 
 def _normalize_uids(uids: Iterable[str]) -> list[str]:
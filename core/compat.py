@@ -20,6 +20,9 @@ if IS_V1:
     def model_dump(model):
         return model.dict()
 
+    def model_copy(model, update: dict):
+        return model.copy(update=update)
+
     class ConfigDict:
         pass
 else:
@@ -28,11 +31,22 @@ else:
     def model_rebuild(model):
         model.model_rebuild()
 
+    _ADAPTERS: dict = {}
+
+    def _type_adapter(type_) -> TypeAdapter:
+        adapter = _ADAPTERS.get(type_)
+        if adapter is None:
+            adapter = _ADAPTERS[type_] = TypeAdapter(type_)
+        return adapter
+
     def type_validate_python(type_, data):
-        return TypeAdapter(type_).validate_python(data)
+        return _type_adapter(type_).validate_python(data)
 
     def type_validate_json(type_, json_data):
-        return TypeAdapter(type_).validate_json(json_data)
+        return _type_adapter(type_).validate_json(json_data)
 
     def model_dump(model):
         return model.model_dump()
+
+    def model_copy(model, update: dict):
+        return model.model_copy(update=update)
@@ -19,12 +19,13 @@ class PluginConfig:
     request_delay_sec: float = 1.5
     request_jitter_sec: float = 30.0
     live_batch_size: int = 50
+    dynamic_fetch_concurrency: int = 1
     risk_cooldown_sec: int = 3600
     enable_link_parser: bool = True
     enable_parser_video_download: bool = False
     parser_video_max_size_mb: int = 30
     parser_video_download_timeout_sec: int = 30
-    search_cache_expiry_hours: int = 48
+    search_cache_expiry_hours: int = 2
     enable_ai_tools: bool = True
     ai_pending_timeout_sec: int = 300
     enable_ai_semantic_dispatch: bool = True
@@ -73,6 +74,12 @@ def load_plugin_config(raw: dict | None) -> PluginConfig:
             min_value=1,
             max_value=100,
         ),
+        dynamic_fetch_concurrency=safe_int(
+            raw.get("dynamic_fetch_concurrency"),
+            1,
+            min_value=1,
+            max_value=8,
+        ),
         risk_cooldown_sec=safe_int(
             raw.get("risk_cooldown_sec"),
             3600,
@@ -97,7 +104,7 @@ def load_plugin_config(raw: dict | None) -> PluginConfig:
         ),
         search_cache_expiry_hours=safe_int(
             raw.get("search_cache_expiry_hours"),
-            48,
+            2,
             min_value=1,
         ),
         enable_ai_tools=safe_bool(raw.get("enable_ai_tools"), True),
@@ -1,25 +1,50 @@
 """HTTP 客户端封装"""
 
+import asyncio
+import ssl
 import time
 from typing import TYPE_CHECKING, Optional
 
+import certifi
 import httpx
 
+from ..utils.logger import logger
 from .config import PluginConfig, load_plugin_config
 
 if TYPE_CHECKING:
     from astrbot.api.star import Star
 
+try:
+    import h2  # noqa: F401
+
+    _HTTP2_AVAILABLE = True
+except ImportError:
+    _HTTP2_AVAILABLE = False
+
+_POOL_LIMITS = httpx.Limits(
+    max_keepalive_connections=10,
+    max_connections=20,
+    keepalive_expiry=60.0,
+)
+_TIMEOUT = httpx.Timeout(10.0, connect=5.0)
+_SSL_CONTEXT: ssl.SSLContext | None = None
+_SAVE_DEBOUNCE_SEC = 0.5
+
 
 class HttpClient:
     _client: httpx.AsyncClient | None = None
+    _client_lock: asyncio.Lock | None = None
     _buvid_initialized: bool = False
     _star_instance: Optional["Star"] = None
     _verify_ssl: bool = True
     _risk_cooldown_sec: int = 3600
 
     _accounts: list[dict] = []
+    _uid_index: dict[str, int] = {}
     _current_account_index: int = 0
+    _save_dirty: bool = False
+    _save_task: asyncio.Task | None = None
+    _write_lock: asyncio.Lock | None = None
 
     @classmethod
     async def set_star_instance(cls, star: "Star"):
@@ -47,32 +72,66 @@ class HttpClient:
 
     @classmethod
     async def load_accounts(cls):
+        if cls._save_dirty:
+            await cls.save_accounts()
         if cls._star_instance:
             db = cls._account_db()
-            cls._accounts = db.get_accounts() if db else []
+            cls._accounts = await asyncio.to_thread(db.get_accounts) if db else []
+            cls._reindex_accounts()
             cls._current_account_index = 0
             await cls._refresh_account_states()
 
     @classmethod
     async def save_accounts(cls):
+        task, cls._save_task = cls._save_task, None
+        if task and not task.done():
+            task.cancel()
+        cls._save_dirty = False
         db = cls._account_db()
         if db:
-            for account in cls._accounts:
-                db.upsert_account(account)
+            async with cls._get_write_lock():
+                snapshot = [dict(account) for account in cls._accounts]
+                await asyncio.to_thread(cls._write_accounts, db, snapshot)
+
+    @staticmethod
+    def _write_accounts(db, accounts: list[dict]):
+        for account in accounts:
+            db.upsert_account(account)
+
+    @classmethod
+    def _get_write_lock(cls) -> asyncio.Lock:
+        if cls._write_lock is None:
+            cls._write_lock = asyncio.Lock()
+        return cls._write_lock
+
+    @classmethod
+    def _schedule_save(cls):
+        cls._save_dirty = True
+        if cls._save_task is None or cls._save_task.done():
+            cls._save_task = asyncio.create_task(cls._flush_after(_SAVE_DEBOUNCE_SEC))
+
+    @classmethod
+    async def _flush_after(cls, delay: float):
+        await asyncio.sleep(delay)
+        if cls._save_task is asyncio.current_task():
+            cls._save_task = None
+        if cls._save_dirty:
+            await cls.save_accounts()
 
     @classmethod
     async def add_account(cls, uid: str, name: str, face: str, cookies: dict):
-        for acc in cls._accounts:
-            if str(acc.get("uid")) == str(uid):
-                acc["name"] = name
-                acc["face"] = face
-                acc["cookies"] = cookies
-                acc["valid"] = True
-                cls._clear_transient_status(acc)
-                await cls.save_accounts()
-                await cls.close()
-                return
+        acc = cls._find_account(uid)
+        if acc is not None:
+            acc["name"] = name
+            acc["face"] = face
+            acc["cookies"] = cookies
+            acc["valid"] = True
+            cls._clear_transient_status(acc)
+            await cls.save_accounts()
+            await cls.close()
+            return
 
+        cls._uid_index[str(uid)] = len(cls._accounts)
         cls._accounts.append(
             {
                 "uid": str(uid),
@@ -94,19 +153,20 @@ class HttpClient:
         cookies: dict | None = None,
         valid: bool = True,
     ):
-        for acc in cls._accounts:
-            if str(acc.get("uid")) == str(uid):
-                acc["name"] = name
-                acc["face"] = face
-                acc["valid"] = valid
-                if cookies is not None:
-                    acc["cookies"] = cookies
-                if valid:
-                    cls._clear_transient_status(acc)
-                await cls.save_accounts()
-                await cls.close()
-                return
+        acc = cls._find_account(uid)
+        if acc is not None:
+            acc["name"] = name
+            acc["face"] = face
+            acc["valid"] = valid
+            if cookies is not None:
+                acc["cookies"] = cookies
+            if valid:
+                cls._clear_transient_status(acc)
+            await cls.save_accounts()
+            await cls.close()
+            return
 
+        cls._uid_index[str(uid)] = len(cls._accounts)
         cls._accounts.append(
             {
                 "uid": str(uid),
@@ -122,13 +182,15 @@ class HttpClient:
     @classmethod
     async def remove_account(cls, uid: str) -> bool:
         uid = str(uid)
-        before = len(cls._accounts)
-        cls._accounts = [acc for acc in cls._accounts if str(acc.get("uid")) != uid]
-        if len(cls._accounts) == before:
+        index = cls._uid_index.get(uid)
+        if index is None:
             return False
+        del cls._accounts[index]
+        cls._reindex_accounts()
         db = cls._account_db()
         if db:
-            db.remove_account(uid)
+            async with cls._get_write_lock():
+                await asyncio.to_thread(db.remove_account, uid)
         cls._current_account_index = min(
             cls._current_account_index,
             max(len(cls._accounts) - 1, 0),
@@ -139,18 +201,19 @@ class HttpClient:
 
     @classmethod
     async def set_account_valid(cls, uid: str, valid: bool) -> bool:
-        for acc in cls._accounts:
-            if str(acc.get("uid")) == str(uid):
-                acc["valid"] = valid
-                cls._clear_transient_status(acc)
-                db = cls._account_db()
-                if db:
-                    db.set_account_valid(uid, valid)
-                else:
-                    await cls.save_accounts()
-                await cls.close()
-                return True
-        return False
+        acc = cls._find_account(uid)
+        if acc is None:
+            return False
+        acc["valid"] = valid
+        cls._clear_transient_status(acc)
+        db = cls._account_db()
+        if db:
+            async with cls._get_write_lock():
+                await asyncio.to_thread(db.set_account_valid, uid, valid)
+        else:
+            await cls.save_accounts()
+        await cls.close()
+        return True
 
     @classmethod
     async def get_accounts(cls) -> list[dict]:
@@ -175,8 +238,6 @@ class HttpClient:
                 if cls._client:
                     cls._client.cookies.clear()
                     cls._client.cookies.update(acc["cookies"])
-                from ..utils.logger import logger
-
                 logger.info(
                     f"Switched to Bilibili account: {acc.get('name')} (UID: {acc.get('uid')})"
                 )
@@ -197,7 +258,7 @@ class HttpClient:
             cls._clear_transient_status(acc)
         else:
             acc["status_code"] = status_code
-        await cls.save_accounts()
+        cls._schedule_save()
 
     @classmethod
     async def invalidate_current_account(cls, status_code: int = None) -> bool:
@@ -208,65 +269,75 @@ class HttpClient:
         acc["status_code"] = status_code
         acc["cooldown_until"] = int(time.time() + cls._risk_cooldown_sec)
         acc["failure_count"] = int(acc.get("failure_count") or 0) + 1
-        from ..utils.logger import logger
-
         logger.warning(
             f"Cooling down account (Code {status_code}): {acc.get('name')} "
             f"(UID: {acc.get('uid')}) for {cls._risk_cooldown_sec}s"
         )
-        await cls.save_accounts()
+        cls._schedule_save()
         return await cls.rotate_account()
 
     @classmethod
     async def get_client(cls) -> httpx.AsyncClient:
-        if cls._client is None or cls._client.is_closed:
-            cls._client = httpx.AsyncClient(
-                headers={
-                    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-                    "Referer": "https://www.bilibili.com/",
-                    "Accept": "application/json, text/plain, */*",
-                    "Accept-Language": "zh-CN,zh;q=0.9,en;q=0.8",
-                },
-                timeout=20.0,
-                follow_redirects=True,
-                cookies={},
-                verify=cls._verify_ssl,
-            )
-            cls._buvid_initialized = False
-
-            if not cls._accounts:
-                await cls.load_accounts()
-            await cls._refresh_account_states()
+        if (
+            cls._client is not None
+            and not cls._client.is_closed
+            and cls._buvid_initialized
+        ):
+            return cls._client
+        if cls._client_lock is None:
+            cls._client_lock = asyncio.Lock()
+
+        async with cls._client_lock:
+            if cls._client is None or cls._client.is_closed:
+                cls._client = httpx.AsyncClient(
+                    headers={
+                        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+                        "Referer": "https://www.bilibili.com/",
+                        "Accept": "application/json, text/plain, */*",
+                        "Accept-Language": "zh-CN,zh;q=0.9,en;q=0.8",
+                    },
+                    timeout=_TIMEOUT,
+                    limits=_POOL_LIMITS,
+                    http2=_HTTP2_AVAILABLE,
+                    follow_redirects=True,
+                    cookies={},
+                    verify=_ssl_verify(cls._verify_ssl),
+                )
+                cls._buvid_initialized = False
 
-            if cls._accounts:
-                acc = cls._accounts[cls._current_account_index]
-                if not cls._is_account_available(acc):
-                    rotated = await cls.rotate_account()
-                    if not rotated:
-                        cls._client.cookies.clear()
-                        return cls._client
-                    acc = cls._accounts[cls._current_account_index]
+                if not cls._accounts:
+                    await cls.load_accounts()
+                await cls._refresh_account_states()
 
-                if cls._is_account_available(acc):
-                    cls._client.cookies.update(acc["cookies"])
+                if cls._accounts:
+                    acc = cls._accounts[cls._current_account_index]
+                    if not cls._is_account_available(acc):
+                        rotated = await cls.rotate_account()
+                        if not rotated:
+                            cls._client.cookies.clear()
+                            return cls._client
+                        acc = cls._accounts[cls._current_account_index]
+
+                    if cls._is_account_available(acc):
+                        cls._client.cookies.update(acc["cookies"])
+                        cls._buvid_initialized = True
+
+            if not cls._buvid_initialized:
+                try:
+                    await cls._client.get("https://www.bilibili.com/", timeout=5.0)
+                    await cls._client.get(
+                        "https://api.bilibili.com/x/frontend/finger/spi", timeout=5.0
+                    )
                     cls._buvid_initialized = True
+                except Exception as e:
+                    logger.warning(f"初始化 B站 Cookies 失败: {e}")
 
-        if not cls._buvid_initialized:
-            try:
-                await cls._client.get("https://www.bilibili.com/", timeout=5.0)
-                await cls._client.get(
-                    "https://api.bilibili.com/x/frontend/finger/spi", timeout=5.0
-                )
-                cls._buvid_initialized = True
-            except Exception as e:
-                from ..utils.logger import logger
-
-                logger.warning(f"初始化 B站 Cookies 失败: {e}")
-
-        return cls._client
+            return cls._client
 
     @classmethod
     async def close(cls):
+        if cls._save_dirty:
+            await cls.save_accounts()
         if cls._client:
             await cls._client.aclose()
             cls._client = None
@@ -287,7 +358,18 @@ class HttpClient:
                 cls._clear_transient_status(acc)
                 changed = True
         if changed:
-            await cls.save_accounts()
+            cls._schedule_save()
+
+    @classmethod
+    def _reindex_accounts(cls):
+        cls._uid_index = {
+            str(acc.get("uid")): index for index, acc in enumerate(cls._accounts)
+        }
+
+    @classmethod
+    def _find_account(cls, uid: str) -> dict | None:
+        index = cls._uid_index.get(str(uid))
+        return cls._accounts[index] if index is not None else None
 
     @staticmethod
     def _clear_transient_status(account: dict):
@@ -298,3 +380,14 @@ class HttpClient:
     @classmethod
     def _account_db(cls):
         return getattr(cls._star_instance, "db", None)
+
+
+def _ssl_verify(verify_ssl: bool) -> ssl.SSLContext | bool:
+    global _SSL_CONTEXT
+    if not verify_ssl:
+        return False
+    if _SSL_CONTEXT is None:
+        _SSL_CONTEXT = ssl.create_default_context(cafile=certifi.where())
+        if _HTTP2_AVAILABLE:
+            _SSL_CONTEXT.set_alpn_protocols(["h2", "http/1.1"])
+    return _SSL_CONTEXT
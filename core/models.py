@@ -317,6 +317,21 @@ Major = (
 
 DynRawPost: TypeAlias = PostAPI.Item
 
+
+class FallbackAPI(Base):
+    """旧版 space_history 接口，card 字段是嵌套的 JSON 字符串"""
+
+    class Card(Base):
+        desc: dict[str, Any] = {}
+        card: str = "{}"
+
+    class Data(Base):
+        cards: "list[FallbackAPI.Card] | None" = None
+
+    code: int
+    message: str = ""
+    data: "FallbackAPI.Data | None" = None
+
 model_rebuild_recurse(VideoMajor)
 model_rebuild_recurse(LiveRecommendMajor)
 model_rebuild_recurse(LiveMajor)
@@ -328,3 +343,4 @@ model_rebuild_recurse(CommonMajor)
 model_rebuild_recurse(CoursesMajor)
 model_rebuild_recurse(UserAPI)
 model_rebuild_recurse(PostAPI)
+model_rebuild_recurse(FallbackAPI)
@@ -52,14 +52,14 @@ class PluginRuntime:
             self.cleanup_task = None
         await self.star.scheduler.terminate()
         await HttpClient.close()
+        self.star.db.close()
 
     async def cleanup_temp_files(self):
         while True:
             try:
-                now = time.time()
-                for file in self.star.temp_dir.iterdir():
-                    if file.is_file() and now - file.stat().st_mtime > 3600:
-                        os.remove(file)
+                await asyncio.to_thread(
+                    _remove_expired_files, self.star.temp_dir, time.time() - 3600
+                )
             except Exception as exc:
                 logger.warning(f"临时文件清理失败: {exc}")
             await asyncio.sleep(1800)
@@ -72,3 +72,10 @@ class PluginRuntime:
             logger.info(f"Bilibili 推送任务已提交给框架: {target_id}")
         except Exception as exc:
             logger.error(f"Bilibili 推送消息失败 ({target_id}): {exc}")
+
+
+def _remove_expired_files(directory: Path, cutoff: float) -> None:
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if entry.is_file(follow_symlinks=False) and entry.stat().st_mtime < cutoff:
+                os.unlink(entry.path)
@@ -21,7 +21,7 @@ class SubUnit(NamedTuple):
     user_sub_infos: list[UserSubInfo]
 
 
-@dataclass
+@dataclass(slots=True)
 class Post:
     """标准推送消息结构"""
 
@@ -38,9 +38,6 @@ class Post:
     category: Optional[int] = None
     type: Any = None
 
-    async def get_content(self) -> str:
-        return self.content
-
 
 class ApiError(Exception):
     def __init__(self, url: str):
@@ -48,12 +45,12 @@ class ApiError(Exception):
         super().__init__(f"API Error: {url}")
 
 
-@dataclass
+@dataclass(slots=True)
 class MsgText:
     text: str
 
 
-@dataclass
+@dataclass(slots=True)
 class MsgImage:
     data: str | Path | bytes
 
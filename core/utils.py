@@ -1,8 +1,18 @@
 import hashlib
+import io
+import operator
+import re
 import time
 import urllib.parse
 from difflib import SequenceMatcher
 
+import segno
+
+try:
+    from rapidfuzz.distance import Indel as _Indel
+except ImportError:
+    _Indel = None
+
 MIXIN_KEY_ENC_TAB = [
     46,
     47,
@@ -71,28 +81,49 @@ MIXIN_KEY_ENC_TAB = [
 ]
 
 
+_MIXIN_KEY_GETTER = operator.itemgetter(*MIXIN_KEY_ENC_TAB[:32])
+_WBI_FILTER_TABLE = str.maketrans("", "", "!'()*")
+
+
 def get_mixin_key(ae):
-    oe = [ae[i] for i in MIXIN_KEY_ENC_TAB]
-    return "".join(oe)[:32]
+    return "".join(_MIXIN_KEY_GETTER(ae))
 
 
 def wbi_sign(params: dict, img_key: str, sub_key: str) -> dict:
-    mixin_key = get_mixin_key(img_key + sub_key)
-    curr_time = int(time.time())
-    params["wts"] = curr_time
-    params = dict(sorted(params.items()))
-    params = {
-        k: "".join(c for c in str(v) if c not in "!'()*") for k, v in params.items()
-    }
-    query = urllib.parse.urlencode(params)
-    w_rid = hashlib.md5((query + mixin_key).encode()).hexdigest()
-    params["w_rid"] = w_rid
-    return params
+    return wbi_sign_with_mixin_key(params, get_mixin_key(img_key + sub_key))
+
+
+def wbi_sign_with_mixin_key(params: dict, mixin_key: str) -> dict:
+    items = sorted(
+        (k, str(v).translate(_WBI_FILTER_TABLE))
+        for k, v in {**params, "wts": int(time.time())}.items()
+    )
+    query = urllib.parse.urlencode(items)
+    signed = dict(items)
+    signed["w_rid"] = hashlib.md5((query + mixin_key).encode()).hexdigest()
+    return signed
 
 
 def text_similarity(text1: str, text2: str) -> float:
+    if _Indel is not None:
+        return _Indel.normalized_similarity(text1, text2)
     return SequenceMatcher(None, text1, text2).ratio()
 
 
+_UNICODE_ESCAPE = re.compile(r"\\u([0-9a-fA-F]{4})")
+
+
 def decode_unicode_escapes(text: str) -> str:
-    return text.encode("utf-8").decode("unicode_escape") if text else ""
+    if not text:
+        return ""
+    if "\\" not in text:
+        return text
+    return _UNICODE_ESCAPE.sub(lambda m: chr(int(m.group(1), 16)), text)
+
+
+def qr_png(data: str, scale: int = 10, border: int = 5) -> bytes:
+    buf = io.BytesIO()
+    segno.make(data, error="l").save(
+        buf, kind="png", scale=scale, border=border, compresslevel=1
+    )
+    return buf.getvalue()
@@ -1,7 +1,10 @@
 from __future__ import annotations
 
 import sqlite3
+import threading
+from contextlib import contextmanager
 from pathlib import Path
+from typing import Iterator
 
 from .accounts import AccountStoreMixin
 from .aliases import AliasStoreMixin
@@ -19,6 +22,8 @@ class DatabaseManager(
 ):
     def __init__(self, db_path: Path):
         self.db_path = db_path
+        self._conn: sqlite3.Connection | None = None
+        self._lock = threading.RLock()
         self._init_db()
 
     def _init_db(self) -> None:
@@ -28,13 +33,28 @@ class DatabaseManager(
             self.sync_targets_from_subscriptions(conn)
             conn.commit()
 
-    def _connect(self) -> sqlite3.Connection:
-        conn = sqlite3.connect(self.db_path, timeout=30)
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        with self._lock:
+            if self._conn is None:
+                self._conn = self._open_connection()
+            with self._conn:
+                yield self._conn
+
+    def _open_connection(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.db_path, timeout=30, check_same_thread=False)
         conn.execute("PRAGMA busy_timeout = 5000")
         conn.execute("PRAGMA journal_mode = WAL")
         conn.execute("PRAGMA synchronous = NORMAL")
+        conn.execute("PRAGMA temp_store = MEMORY")
         conn.execute("PRAGMA foreign_keys = ON")
         return conn
 
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
 
 __all__ = ["DatabaseManager", "Subscription", "Target"]
@@ -1,9 +1,9 @@
 from __future__ import annotations
 
-import json
 import sqlite3
 from typing import Optional
 
+from ..utils.json_codec import dumps as json_dumps, loads as json_loads
 from ..utils.logger import logger
 from .models import Subscription
 
@@ -139,8 +139,8 @@ class SubscriptionStoreMixin:
             sub.username,
             sub.sub_type,
             sub.target_id,
-            json.dumps(sub.categories),
-            json.dumps(sub.tags),
+            json_dumps(sub.categories),
+            json_dumps(sub.tags),
             1 if sub.enabled else 0,
         )
 
@@ -151,7 +151,7 @@ class SubscriptionStoreMixin:
             username=row[1],
             sub_type=row[2],
             target_id=row[3],
-            categories=json.loads(row[4] or "[]"),
-            tags=json.loads(row[5] or "[]"),
+            categories=json_loads(row[4] or "[]"),
+            tags=json_loads(row[5] or "[]"),
             enabled=bool(row[6]),
         )
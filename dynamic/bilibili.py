@@ -1,15 +1,17 @@
 """Bilibili 动态平台实现"""
 
-import json
+import asyncio
 import time
 from typing import ClassVar
 
 from ..core.compat import type_validate_json
-from ..core.models import DynRawPost, PostAPI, UserAPI
+from ..core.http import HttpClient
+from ..core.models import DynRawPost, FallbackAPI, PostAPI, UserAPI
 from ..core.network_retry import get_with_retry
 from ..core.platform import NewMessagePlatform
 from ..core.types import ApiError, Category, Post, Target
-from ..core.utils import wbi_sign
+from ..core.utils import get_mixin_key, wbi_sign_with_mixin_key
+from ..utils.json_codec import loads as json_loads, response_json
 from ..utils.logger import logger
 from .fallback import FallbackCardConverter
 from .post_parser import DynamicPostParser
@@ -29,9 +31,25 @@ class BilibiliDynamic(DynamicPostParser, FallbackCardConverter, NewMessagePlatfo
 
     _wbi_keys: tuple[str, str] | None = None
     _wbi_keys_time: float = 0
+    _wbi_mixin_key: str = ""
+    _wbi_lock: asyncio.Lock | None = None
+
+    def _wbi_keys_fresh(self) -> bool:
+        return bool(self._wbi_keys) and time.time() - self._wbi_keys_time < 3600
+
+    async def _get_wbi_mixin_key(self) -> str:
+        if self._wbi_keys_fresh():
+            return self._wbi_mixin_key
+        if self._wbi_lock is None:
+            self._wbi_lock = asyncio.Lock()
+        async with self._wbi_lock:
+            if not self._wbi_keys_fresh():
+                img_key, sub_key = await self._get_wbi_keys()
+                self._wbi_mixin_key = get_mixin_key(img_key + sub_key)
+        return self._wbi_mixin_key
 
     async def _get_wbi_keys(self) -> tuple[str, str]:
-        if self._wbi_keys and time.time() - self._wbi_keys_time < 3600:
+        if self._wbi_keys_fresh():
             return self._wbi_keys
 
         client = await self.get_client()
@@ -40,7 +58,7 @@ class BilibiliDynamic(DynamicPostParser, FallbackCardConverter, NewMessagePlatfo
             "https://api.bilibili.com/x/web-interface/nav",
             label="获取 WBI Keys",
         )
-        res_json = res.json()
+        res_json = response_json(res)
         if "data" not in res_json or "wbi_img" not in res_json["data"]:
             raise ApiError(f"获取 WBI Keys 失败: {res_json.get('message', '未知错误')}")
 
@@ -89,8 +107,6 @@ class BilibiliDynamic(DynamicPostParser, FallbackCardConverter, NewMessagePlatfo
     async def _try_polymer_then_fallback(self, target: Target) -> list[DynRawPost]:
         try:
             posts = await self._get_sub_list_polymer(target)
-            from ..core.http import HttpClient
-
             await HttpClient.set_current_account_status(valid=True, status_code=None)
             if posts:
                 return posts
@@ -127,8 +143,6 @@ class BilibiliDynamic(DynamicPostParser, FallbackCardConverter, NewMessagePlatfo
         if not any(code in err_msg for code in ("352", "412", "403")):
             return None
 
-        from ..core.http import HttpClient
-
         status_code = 412 if "412" in err_msg else (352 if "352" in err_msg else 403)
         logger.warning(f"检测到 B站 风控 ({err_msg})，正在自动切换账号...")
         if not await HttpClient.invalidate_current_account(status_code=status_code):
@@ -145,15 +159,14 @@ class BilibiliDynamic(DynamicPostParser, FallbackCardConverter, NewMessagePlatfo
         client = await self.get_client()
         params = {"host_mid": target, "features": "itemOpusStyle"}
 
-        img_key, sub_key = await self._get_wbi_keys()
-        signed_params = wbi_sign(params.copy(), img_key, sub_key)
+        mixin_key = await self._get_wbi_mixin_key()
+        signed_params = wbi_sign_with_mixin_key(params, mixin_key)
         res = await get_with_retry(
             client,
             "https://api.bilibili.com/x/polymer/web-dynamic/v1/feed/space",
             label=f"获取动态列表 Polymer {target}",
             params=signed_params,
             headers={"Referer": f"https://space.bilibili.com/{target}/dynamic"},
-            timeout=10.0,
         )
         if res.status_code == 412:
             raise ApiError("412 Precondition Failed")
@@ -162,7 +175,9 @@ class BilibiliDynamic(DynamicPostParser, FallbackCardConverter, NewMessagePlatfo
         res_obj = type_validate_json(PostAPI, res.content)
         if res_obj.code == 0:
             if (data := res_obj.data) and (items := data.items):
-                return [item for item in items if item.type != "DYNAMIC_TYPE_NONE"]
+                if any(item.type == "DYNAMIC_TYPE_NONE" for item in items):
+                    items = [item for item in items if item.type != "DYNAMIC_TYPE_NONE"]
+                return items
             return []
         if res_obj.code == -352:
             raise ApiError("Risk Control -352")
@@ -181,19 +196,17 @@ class BilibiliDynamic(DynamicPostParser, FallbackCardConverter, NewMessagePlatfo
                 "platform": "web",
             },
             headers={"Referer": f"https://space.bilibili.com/{target}/dynamic"},
-            timeout=10.0,
         )
         res.raise_for_status()
-        data = res.json()
-        if data["code"] != 0:
-            raise ApiError(f"Fallback Code {data['code']}")
+        res_obj = type_validate_json(FallbackAPI, res.content)
+        if res_obj.code != 0:
+            raise ApiError(f"Fallback Code {res_obj.code}")
 
         converted_posts = []
-        for card in data.get("data", {}).get("cards", []):
+        for card in (res_obj.data and res_obj.data.cards) or []:
             try:
-                desc = card.get("desc", {})
-                card_json = json.loads(card.get("card", "{}"))
-                post = self._convert_fallback_card(desc, card_json)
+                card_json = json_loads(card.card or "{}")
+                post = self._convert_fallback_card(card.desc, card_json)
                 if post:
                     converted_posts.append(post)
             except Exception as exc:
@@ -202,7 +215,4 @@ class BilibiliDynamic(DynamicPostParser, FallbackCardConverter, NewMessagePlatfo
 
     async def fetch_new_post(self, sub_unit) -> list[Post]:
         raw_posts = await self.get_sub_list(sub_unit.sub_target)
-        posts = []
-        for raw_post in raw_posts:
-            posts.append(await self.parse(raw_post))
-        return posts
+        return [self.parse_post(raw_post) for raw_post in raw_posts]
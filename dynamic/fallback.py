@@ -1,44 +1,62 @@
-import json
-
 from ..core.models import ArticleMajor, DrawMajor, DynRawPost, PostAPI, VideoMajor
+from ..utils.json_codec import loads as json_loads
 from ..utils.logger import logger
 
 
-def _get_any(data: dict, *keys):
-    for key in keys:
-        if "." in key:
-            value = data
-            try:
-                for part in key.split("."):
-                    if not isinstance(value, dict):
-                        value = None
-                        break
-                    value = value.get(part)
-            except Exception:
+_DYNAMIC_TYPE_AV = "DYNAMIC_TYPE_AV"
+_DYNAMIC_TYPE_DRAW = "DYNAMIC_TYPE_DRAW"
+_DYNAMIC_TYPE_ARTICLE = "DYNAMIC_TYPE_ARTICLE"
+_DYNAMIC_TYPE_FORWARD = "DYNAMIC_TYPE_FORWARD"
+_DYNAMIC_TYPE_WORD = "DYNAMIC_TYPE_WORD"
+
+_SPACE_URL = "https://space.bilibili.com/"
+_VIDEO_URL = "https://www.bilibili.com/video/"
+_READ_URL = "https://www.bilibili.com/read/cv"
+
+_FALLBACK_TYPES = {
+    8: _DYNAMIC_TYPE_AV,
+    2: _DYNAMIC_TYPE_DRAW,
+    11: _DYNAMIC_TYPE_DRAW,
+    64: _DYNAMIC_TYPE_ARTICLE,
+    12: _DYNAMIC_TYPE_ARTICLE,
+    1: _DYNAMIC_TYPE_FORWARD,
+    4: _DYNAMIC_TYPE_WORD,
+}
+
+_PUB_TS_PATHS = (("item", "upload_time"), ("pubdate",), ("ctime",))
+_PICTURE_PATHS = (("item", "pictures"), ("item", "images"), ("pics",))
+_TITLE_PATHS = (("item", "title"), ("title",))
+_DRAW_DESC_PATHS = (("item", "description"), ("item", "content"), ("desc",))
+_WORD_TEXT_PATHS = (("item", "content"), ("item", "description"), ("dynamic",))
+_FORWARD_TEXT_PATHS = (("item", "content"), ("dynamic",), ("desc",))
+_FALLBACK_TEXT_PATHS = (
+    ("dynamic",),
+    ("desc",),
+    ("summary",),
+    ("title",),
+    ("content",),
+)
+
+
+def _get_any(data: dict, paths: tuple[tuple[str, ...], ...]):
+    for path in paths:
+        value = data
+        for part in path:
+            if not isinstance(value, dict):
                 value = None
-            if value:
-                return value
-        elif data.get(key):
-            return data[key]
+                break
+            value = value.get(part)
+        if value:
+            return value
     return ""
 
 
 class FallbackCardConverter:
     def _convert_fallback_card(self, desc: dict, card_json: dict) -> DynRawPost | None:
         try:
-            type_map = {
-                8: "DYNAMIC_TYPE_AV",
-                2: "DYNAMIC_TYPE_DRAW",
-                11: "DYNAMIC_TYPE_DRAW",
-                64: "DYNAMIC_TYPE_ARTICLE",
-                12: "DYNAMIC_TYPE_ARTICLE",
-                1: "DYNAMIC_TYPE_FORWARD",
-                4: "DYNAMIC_TYPE_WORD",
-            }
-
             try:
                 raw_type = int(desc.get("type", 0))
-            except Exception:
+            except (TypeError, ValueError):
                 raw_type = 0
 
             if raw_type == 0:
@@ -49,18 +67,19 @@ class FallbackCardConverter:
                 elif "item" in card_json and "upload_time" in card_json["item"]:
                     raw_type = 4
 
-            dyn_type = type_map.get(raw_type, "DYNAMIC_TYPE_WORD")
+            dyn_type = _FALLBACK_TYPES.get(raw_type, _DYNAMIC_TYPE_WORD)
             user_profile = desc.get("user_profile", {}).get("info", {})
             if not user_profile:
                 user_profile = card_json.get("user", {})
 
+            uid = user_profile.get("uid", 0)
             author = PostAPI.Modules.Author(
                 face=user_profile.get("face", "") or user_profile.get("head_url", ""),
-                mid=user_profile.get("uid", 0),
+                mid=uid,
                 name=user_profile.get("uname", "") or user_profile.get("name", ""),
-                jump_url=f"https://space.bilibili.com/{user_profile.get('uid', 0)}",
+                jump_url=_SPACE_URL + str(uid),
                 pub_ts=desc.get("timestamp", 0)
-                or _get_any(card_json, "item.upload_time", "pubdate", "ctime")
+                or _get_any(card_json, _PUB_TS_PATHS)
                 or 0,
                 type="AUTHOR_TYPE_NORMAL",
             )
@@ -69,7 +88,7 @@ class FallbackCardConverter:
             text_desc = ""
             orig_item = None
 
-            if dyn_type == "DYNAMIC_TYPE_AV":
+            if dyn_type == _DYNAMIC_TYPE_AV:
                 bvid = desc.get("bvid", "") or card_json.get("bvid", "")
                 major = VideoMajor(
                     type="MAJOR_TYPE_ARCHIVE",
@@ -79,48 +98,41 @@ class FallbackCardConverter:
                         title=card_json.get("title", ""),
                         desc=card_json.get("desc", ""),
                         cover=card_json.get("pic", ""),
-                        jump_url=f"https://www.bilibili.com/video/{bvid}",
+                        jump_url=_VIDEO_URL + bvid,
                     ),
                 )
                 text_desc = card_json.get("dynamic", "")
 
-            elif dyn_type == "DYNAMIC_TYPE_DRAW":
+            elif dyn_type == _DYNAMIC_TYPE_DRAW:
                 items = [
                     DrawMajor.Item(width=0, height=0, src=pic.get("img_src", ""))
-                    for pic in (
-                        _get_any(card_json, "item.pictures", "item.images", "pics")
-                        or []
-                    )
+                    for pic in _get_any(card_json, _PICTURE_PATHS) or []
                 ]
                 major = DrawMajor(
                     type="MAJOR_TYPE_DRAW",
                     draw=DrawMajor.Draw(
                         id=0,
                         items=items,
-                        title=_get_any(card_json, "item.title", "title"),
+                        title=_get_any(card_json, _TITLE_PATHS),
                     ),
                 )
-                text_desc = _get_any(
-                    card_json, "item.description", "item.content", "desc"
-                )
+                text_desc = _get_any(card_json, _DRAW_DESC_PATHS)
 
-            elif dyn_type == "DYNAMIC_TYPE_WORD":
-                text_desc = _get_any(
-                    card_json, "item.content", "item.description", "dynamic"
-                )
-                pics = _get_any(card_json, "item.pictures", "item.images", "pics") or []
+            elif dyn_type == _DYNAMIC_TYPE_WORD:
+                text_desc = _get_any(card_json, _WORD_TEXT_PATHS)
+                pics = _get_any(card_json, _PICTURE_PATHS) or []
                 items = [
                     DrawMajor.Item(width=0, height=0, src=pic.get("img_src", ""))
                     for pic in pics
                 ]
                 if items:
-                    dyn_type = "DYNAMIC_TYPE_DRAW"
+                    dyn_type = _DYNAMIC_TYPE_DRAW
                     major = DrawMajor(
                         type="MAJOR_TYPE_DRAW",
                         draw=DrawMajor.Draw(id=0, items=items),
                     )
 
-            elif dyn_type == "DYNAMIC_TYPE_ARTICLE":
+            elif dyn_type == _DYNAMIC_TYPE_ARTICLE:
                 major = ArticleMajor(
                     type="MAJOR_TYPE_ARTICLE",
                     article=ArticleMajor.Article(
@@ -128,18 +140,16 @@ class FallbackCardConverter:
                         title=card_json.get("title", ""),
                         desc=card_json.get("summary", ""),
                         covers=card_json.get("image_urls", []),
-                        jump_url=f"https://www.bilibili.com/read/cv{desc.get('rid', '')}",
+                        jump_url=_READ_URL + str(desc.get("rid", "")),
                     ),
                 )
 
-            elif dyn_type == "DYNAMIC_TYPE_FORWARD":
-                text_desc = _get_any(card_json, "item.content", "dynamic", "desc")
+            elif dyn_type == _DYNAMIC_TYPE_FORWARD:
+                text_desc = _get_any(card_json, _FORWARD_TEXT_PATHS)
                 orig_item = self._convert_origin_card(card_json)
 
             if not text_desc:
-                text_desc = _get_any(
-                    card_json, "dynamic", "desc", "summary", "title", "content"
-                )
+                text_desc = _get_any(card_json, _FALLBACK_TEXT_PATHS)
 
             return PostAPI.Item(
                 basic=PostAPI.Basic(rid_str=str(desc.get("rid", ""))),
@@ -164,7 +174,7 @@ class FallbackCardConverter:
         if "origin" not in card_json:
             return None
         try:
-            origin_json = json.loads(card_json["origin"])
+            origin_json = json_loads(card_json["origin"] or "{}")
             orig_type = card_json.get("item", {}).get("orig_type")
             if not orig_type:
                 if "aid" in origin_json:
@@ -175,10 +185,7 @@ class FallbackCardConverter:
             orig_desc = {
                 "type": orig_type,
                 "user_profile": {"info": origin_json.get("user", {})},
-                "timestamp": _get_any(
-                    origin_json, "item.upload_time", "pubdate", "ctime"
-                )
-                or 0,
+                "timestamp": _get_any(origin_json, _PUB_TS_PATHS) or 0,
                 "rid": origin_json.get("rid", ""),
                 "bvid": origin_json.get("bvid", ""),
             }
@@ -1,7 +1,5 @@
 from typing import NamedTuple
 
-from yarl import URL
-
 from ..core.compat import type_validate_json
 from ..core.models import (
     ArticleMajor,
@@ -18,6 +16,37 @@ from ..core.types import Category, Post, Tag
 from ..core.utils import text_similarity
 
 
+_CATEGORY_BY_TYPE: dict[str, Category] = {
+    "DYNAMIC_TYPE_DRAW": Category(1),
+    "DYNAMIC_TYPE_COMMON_VERTICAL": Category(1),
+    "DYNAMIC_TYPE_COMMON_SQUARE": Category(1),
+    "DYNAMIC_TYPE_ARTICLE": Category(2),
+    "DYNAMIC_TYPE_AV": Category(3),
+    "DYNAMIC_TYPE_WORD": Category(4),
+    "DYNAMIC_TYPE_FORWARD": Category(5),
+    "DYNAMIC_TYPE_LIVE_RCMD": Category(6),
+    "DYNAMIC_TYPE_LIVE": Category(6),
+}
+
+
+def _similar(text1: str, text2: str, threshold: float) -> bool:
+    if not text1 or not text2:
+        return False
+    if text1 == text2:
+        return True
+    if 2 * min(len(text1), len(text2)) <= threshold * (len(text1) + len(text2)):
+        return False
+    return text_similarity(text1, text2) > threshold
+
+
+def _to_https(url: str) -> str:
+    if url.startswith("//"):
+        return "https:" + url
+    if url.startswith("http://"):
+        return "https://" + url[7:]
+    return url
+
+
 class _ProcessedText(NamedTuple):
     title: str
     content: str
@@ -38,25 +67,7 @@ class DynamicPostParser:
         return post.modules.module_author.pub_ts
 
     def _do_get_category(self, post_type: DynamicType) -> Category:
-        match post_type:
-            case (
-                "DYNAMIC_TYPE_DRAW"
-                | "DYNAMIC_TYPE_COMMON_VERTICAL"
-                | "DYNAMIC_TYPE_COMMON_SQUARE"
-            ):
-                return Category(1)
-            case "DYNAMIC_TYPE_ARTICLE":
-                return Category(2)
-            case "DYNAMIC_TYPE_AV":
-                return Category(3)
-            case "DYNAMIC_TYPE_WORD":
-                return Category(4)
-            case "DYNAMIC_TYPE_FORWARD":
-                return Category(5)
-            case "DYNAMIC_TYPE_LIVE_RCMD" | "DYNAMIC_TYPE_LIVE":
-                return Category(6)
-            case _:
-                return Category(99)
+        return _CATEGORY_BY_TYPE.get(post_type, Category(99))
 
     def get_category(self, post: DynRawPost) -> Category:
         return self._do_get_category(post.type)
@@ -72,19 +83,10 @@ class DynamicPostParser:
         return tags
 
     def _text_process(self, dynamic: str, desc: str, title: str) -> _ProcessedText:
-        title_similarity = (
-            0.0
-            if len(title) == 0 or len(desc) == 0
-            else text_similarity(title, desc[: len(title)])
-        )
-        if title_similarity > 0.9:
-            desc = desc[len(title) :].lstrip()
-        content_similarity = (
-            0.0
-            if len(dynamic) == 0 or len(desc) == 0
-            else text_similarity(dynamic, desc)
-        )
-        if content_similarity > 0.8:
+        if title and desc:
+            if desc.startswith(title) or text_similarity(title, desc[: len(title)]) > 0.9:
+                desc = desc[len(title) :].lstrip()
+        if _similar(dynamic, desc, 0.8):
             return _ProcessedText(title, desc if len(dynamic) < len(desc) else dynamic)
         return _ProcessedText(
             title,
@@ -93,61 +95,69 @@ class DynamicPostParser:
 
     def pre_parse_by_mojar(self, raw_post: DynRawPost) -> _ParsedMajorPost:
         dyn = raw_post.modules.module_dynamic
-        major = dyn.major
-
-        if isinstance(major, VideoMajor):
-            archive = major.archive
-            desc_text = dyn.desc.text if dyn.desc else ""
-            parsed = self._text_process(desc_text, archive.desc, archive.title)
-            return _ParsedMajorPost(
-                parsed.title,
-                parsed.content,
-                [archive.cover],
-                str(URL(archive.jump_url).with_scheme("https")),
-            )
-        if isinstance(major, LiveRecommendMajor):
-            live_rcmd = major.live_rcmd
-            content_data = type_validate_json(
-                LiveRecommendMajor.Content, live_rcmd.content
-            )
-            live_info = content_data.live_play_info
-            return _ParsedMajorPost(
-                live_info.title,
-                f"{live_info.parent_area_name} {live_info.area_name}",
-                [live_info.cover],
-                str(URL(live_info.link).with_scheme("https").with_query(None)),
-            )
-        if isinstance(major, LiveMajor):
-            live = major.live
-            return _ParsedMajorPost(
-                live.title,
-                f"{live.desc_first}\n{live.desc_second}",
-                [live.cover],
-                str(URL(live.jump_url).with_scheme("https")),
-            )
-        if isinstance(major, DrawMajor):
-            return self._parse_draw(raw_post, major)
-        if isinstance(major, ArticleMajor):
-            return _ParsedMajorPost(
-                major.article.title,
-                major.article.desc,
-                major.article.covers,
-                str(URL(major.article.jump_url).with_scheme("https")),
-            )
-        if isinstance(major, OPUSMajor):
-            opus = major.opus
-            text = opus.summary.text
-            title = opus.title or self._title_from_text(text)
-            return _ParsedMajorPost(
-                title,
-                text,
-                [pic.url for pic in opus.pics],
-                opus.jump_url,
-            )
+        parse_major = self._MAJOR_PARSERS.get(type(dyn.major))
+        if parse_major is not None:
+            return parse_major(self, raw_post, dyn.major)
 
         desc = dyn.desc.text if dyn.desc else ""
         return _ParsedMajorPost("", desc, [], f"https://t.bilibili.com/{raw_post.id_str}")
 
+    def _parse_video(self, raw_post: DynRawPost, major: VideoMajor) -> _ParsedMajorPost:
+        dyn = raw_post.modules.module_dynamic
+        archive = major.archive
+        desc_text = dyn.desc.text if dyn.desc else ""
+        parsed = self._text_process(desc_text, archive.desc, archive.title)
+        return _ParsedMajorPost(
+            parsed.title,
+            parsed.content,
+            [archive.cover],
+            _to_https(archive.jump_url),
+        )
+
+    def _parse_live_rcmd(
+        self, raw_post: DynRawPost, major: LiveRecommendMajor
+    ) -> _ParsedMajorPost:
+        content_data = type_validate_json(
+            LiveRecommendMajor.Content, major.live_rcmd.content
+        )
+        live_info = content_data.live_play_info
+        return _ParsedMajorPost(
+            live_info.title,
+            f"{live_info.parent_area_name} {live_info.area_name}",
+            [live_info.cover],
+            _to_https(live_info.link.split("?", 1)[0]),
+        )
+
+    def _parse_live(self, raw_post: DynRawPost, major: LiveMajor) -> _ParsedMajorPost:
+        live = major.live
+        return _ParsedMajorPost(
+            live.title,
+            f"{live.desc_first}\n{live.desc_second}",
+            [live.cover],
+            _to_https(live.jump_url),
+        )
+
+    def _parse_article(
+        self, raw_post: DynRawPost, major: ArticleMajor
+    ) -> _ParsedMajorPost:
+        return _ParsedMajorPost(
+            major.article.title,
+            major.article.desc,
+            major.article.covers,
+            _to_https(major.article.jump_url),
+        )
+
+    def _parse_opus(self, raw_post: DynRawPost, major: OPUSMajor) -> _ParsedMajorPost:
+        opus = major.opus
+        text = opus.summary.text
+        title = opus.title or self._title_from_text(text)
+        return _ParsedMajorPost(
+            title,
+            text,
+            [pic.url for pic in opus.pics],
+            opus.jump_url,
+        )
+
     def _parse_draw(self, raw_post: DynRawPost, major: DrawMajor) -> _ParsedMajorPost:
         dyn = raw_post.modules.module_dynamic
         text = dyn.desc.text if dyn.desc else ""
@@ -163,6 +173,15 @@ class DynamicPostParser:
             f"https://t.bilibili.com/{raw_post.id_str}",
         )
 
+    _MAJOR_PARSERS = {
+        VideoMajor: _parse_video,
+        LiveRecommendMajor: _parse_live_rcmd,
+        LiveMajor: _parse_live,
+        DrawMajor: _parse_draw,
+        ArticleMajor: _parse_article,
+        OPUSMajor: _parse_opus,
+    }
+
     def _title_from_text(self, text: str) -> str:
         if not text:
             return ""
@@ -170,6 +189,9 @@ class DynamicPostParser:
         return first_line[:30] + "..." if len(first_line) > 30 else first_line
 
     async def parse(self, raw_post: DynRawPost) -> Post:
+        return self.parse_post(raw_post)
+
+    def parse_post(self, raw_post: DynRawPost) -> Post:
         parsed_raw_post = self.pre_parse_by_mojar(raw_post)
         repost = self._parse_repost(raw_post)
 
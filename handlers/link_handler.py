@@ -1,3 +1,5 @@
+import re
+
 import astrbot.api.message_components as Comp
 from astrbot.api import logger
 from astrbot.api.event import AstrMessageEvent
@@ -7,6 +9,9 @@ from ..parser.video_downloader import BilibiliVideoDownloader
 from ..rendering import RendererPort
 
 
+_BILI_RE = re.compile(r"bilibili\.com|b23\.tv|BV[0-9A-Za-z]{10}|av\d+", re.IGNORECASE)
+
+
 class LinkParserHandler:
     def __init__(
         self,
@@ -18,24 +23,24 @@ class LinkParserHandler:
     ):
         self.context = context
         self.template_name = template_name
+        self.final_template = (
+            template_name
+            if template_name.endswith(".jinja")
+            else f"{template_name}.html.jinja"
+        )
         self.renderer = renderer
         self.video_downloader = video_downloader
         self.enable_video_download = enable_video_download
 
     async def handle_links(self, event: AstrMessageEvent, parser, enable_link_parser):
-        if not enable_link_parser:
+        if not enable_link_parser or not _BILI_RE.search(event.message_str or ""):
             return
         info = await parser.parse_message(event.message_str)
         if not info:
             return
         try:
-            final_template = (
-                f"{self.template_name}.html.jinja"
-                if not self.template_name.endswith(".jinja")
-                else self.template_name
-            )
             img_bytes = await self.renderer.render(
-                final_template,
+                self.final_template,
                 info,
                 viewport={"width": 640, "height": 800},
                 selector=".card",
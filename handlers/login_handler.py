@@ -1,96 +1,107 @@
 import asyncio
-import io
 import time
 from pathlib import Path
 
-import qrcode
-
 import astrbot.api.message_components as Comp
 from astrbot.api import logger
 from astrbot.api.event import AstrMessageEvent
 from astrbot.api.star import Context
 
 from ..core.http import HttpClient
+from ..core.utils import qr_png
+from ..utils.json_codec import response_json
 from ..rendering import RendererPort
 
 
+_STATUS_LABELS = {412: "风控 412", 352: "拦截 352"}
+
+
 class LoginHandler:
     def __init__(
         self,
         context: Context,
-        temp_dir: Path,
         bg_dir: Path,
         renderer: RendererPort,
     ):
         self.context = context
-        self.temp_dir = temp_dir
         self.bg_dir = bg_dir
         self.renderer = renderer
+        self._pending_logins: set[str] = set()
+        self._closed = False
+
+    def close(self) -> None:
+        self._closed = True
 
     async def handle_login(self, event: AstrMessageEvent):
+        origin = event.unified_msg_origin
+        if origin in self._pending_logins:
+            yield event.plain_result("⏳ 当前会话已有进行中的扫码登录，请先完成或等待超时")
+            return
+        self._pending_logins.add(origin)
+        try:
+            async for result in self._run_login(event):
+                yield result
+        finally:
+            self._pending_logins.discard(origin)
+
+    async def _run_login(self, event: AstrMessageEvent):
         client = await HttpClient.get_client()
         try:
             res = await client.get(
                 "https://passport.bilibili.com/x/passport-login/web/qrcode/generate"
             )
-            data = res.json()["data"]
+            data = response_json(res)["data"]
             url, qrcode_key = data["url"], data["qrcode_key"]
         except Exception as e:
             yield event.plain_result(f"❌ 二维码获取失败: {e}")
             return
 
-        qr = qrcode.QRCode(version=1, box_size=10, border=5)
-        qr.add_data(url)
-        qr.make(fit=True)
-        img = qr.make_image(fill_color="black", back_color="white")
-        img_byte_arr = io.BytesIO()
-        img.save(img_byte_arr, format="PNG")
-
-        qr_path = self.temp_dir / f"qr_{int(time.time())}.png"
-        with open(qr_path, "wb") as f:
-            f.write(img_byte_arr.getvalue())
+        qr_bytes = await asyncio.to_thread(qr_png, url)
 
         yield event.chain_result(
             [
                 Comp.Plain("请使用 B站 App 扫码登录：\n"),
-                Comp.Image.fromFileSystem(str(qr_path.absolute())),
+                Comp.Image.fromBytes(qr_bytes),
             ]
         )
 
-        for _ in range(30):
-            await asyncio.sleep(4)
+        deadline = time.monotonic() + 180
+        delay = 0.5
+        while time.monotonic() < deadline:
+            await asyncio.sleep(delay)
+            if self._closed:
+                return
             try:
                 check_res = await client.get(
                     "https://passport.bilibili.com/x/passport-login/web/qrcode/poll",
                     params={"qrcode_key": qrcode_key},
                 )
-                check_data = check_res.json()["data"]
+                check_data = response_json(check_res)["data"]
                 if check_data["code"] == 0:
                     new_cookies = dict(check_res.cookies)
                     uid = new_cookies.get("DedeUserID") or str(
                         check_data.get("mid", "")
                     )
-                    try:
-                        nav_res = await client.get(
-                            "https://api.bilibili.com/x/web-interface/nav",
-                            cookies=new_cookies,
-                            timeout=5,
-                        )
-                        nav_data = nav_res.json()
-                        if nav_data["code"] == 0:
-                            n = nav_data["data"]
-                            uid, uname, face = (
-                                str(n.get("mid")),
-                                n.get("uname"),
-                                n.get("face"),
-                            )
-                        else:
-                            uname, face = (
-                                check_data.get("uname", "未知"),
-                                check_data.get("face", ""),
+                    uname = check_data.get("uname")
+                    face = check_data.get("face", "")
+                    if not uname:
+                        uname = "未知"
+                        try:
+                            nav_res = await client.get(
+                                "https://api.bilibili.com/x/web-interface/nav",
+                                cookies=new_cookies,
+                                timeout=2,
                             )
-                    except Exception:
-                        uname, face = check_data.get("uname", "未知"), ""
+                            nav_data = response_json(nav_res)
+                            if nav_data["code"] == 0:
+                                n = nav_data["data"]
+                                uid, uname, face = (
+                                    str(n.get("mid")),
+                                    n.get("uname"),
+                                    n.get("face"),
+                                )
+                        except Exception:
+                            pass
                     await HttpClient.add_account(
                         uid=uid, name=uname, face=face, cookies=new_cookies
                     )
@@ -101,8 +112,13 @@ class LoginHandler:
                 elif check_data["code"] == 86038:
                     yield event.plain_result("❌ 二维码已失效")
                     return
+                elif check_data["code"] == 86090:
+                    delay = 2.0
+                else:
+                    delay = min(delay * 1.5, 4.0)
             except Exception as e:
                 logger.error(f"Login QR poll failed: {e}")
+                delay = min(delay * 2, 8.0)
         yield event.plain_result("⏳ 登录超时")
 
     async def handle_status(self, event: AstrMessageEvent):
@@ -123,11 +139,7 @@ class LoginHandler:
             if cooldown_until:
                 status_label = "风控冷却中"
             elif status_code:
-                status_label = f"Code {status_code}"
-                if str(status_code) == "412":
-                    status_label = "风控 412"
-                elif str(status_code) == "352":
-                    status_label = "拦截 352"
+                status_label = _STATUS_LABELS.get(status_code, f"Code {status_code}")
             elif not is_valid:
                 status_label = "失效"
 
@@ -3,6 +3,7 @@ from astrbot.api import logger
 
 from ..database.db_manager import Subscription
 from ..rendering import RendererPort
+from ..workflows.cards import subscription_change_card
 
 
 class SubscriptionEditor:
@@ -84,15 +85,16 @@ class SubscriptionEditor:
         sub_type: str,
         action: str,
     ) -> bytes:
+        card = subscription_change_card(
+            username=username,
+            face=face,
+            uid=uid,
+            sub_type=sub_type,
+            action=action,
+        )
         return await self.renderer.render(
-            "sub_add.html.jinja",
-            {
-                "username": username,
-                "face": face,
-                "uid": uid,
-                "sub_type": sub_type,
-                "action": action,
-            },
-            viewport={"width": 400, "height": 400},
-            selector=".card",
+            card.template_name,
+            card.templates,
+            viewport=card.viewport,
+            selector=card.selector,
         )
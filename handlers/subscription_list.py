@@ -3,7 +3,7 @@ from pathlib import Path
 import astrbot.api.message_components as Comp
 from astrbot.api import logger
 
-from ..core.avatar_cache import NO_FACE, fetch_avatar_map
+from ..core.avatar_cache import NO_FACE, fetch_faces_with_live
 from ..rendering import RendererPort
 
 
@@ -21,8 +21,13 @@ class SubscriptionListPresenter:
 
         yield event.plain_result("⏳ 正在获取订阅详细信息...")
         subs_map = self._build_sub_map(subs)
-        face_map = await self._fetch_face_map(subs_map.keys(), scheduler)
-        live_status_map = await self._fetch_live_status_map(subs_map, scheduler)
+        live_infos, face_map = await fetch_faces_with_live(
+            getattr(scheduler, "star", None),
+            subs_map.keys(),
+            [uid for uid, sub in subs_map.items() if sub["has_live"]],
+            self._fetch_live_infos(subs_map, scheduler),
+        )
+        live_status_map = {str(info.uid): info.live_status == 1 for info in live_infos}
         all_subs = self._compose_rows(subs_map, face_map, live_status_map)
 
         try:
@@ -56,18 +61,14 @@ class SubscriptionListPresenter:
                 subs_map[sub.uid]["has_live"] = True
         return subs_map
 
-    async def _fetch_face_map(self, uids, scheduler) -> dict:
-        return await fetch_avatar_map(getattr(scheduler, "star", None), uids)
-
-    async def _fetch_live_status_map(self, subs_map: dict, scheduler) -> dict:
+    async def _fetch_live_infos(self, subs_map: dict, scheduler) -> list:
         live_uids = [uid for uid, sub in subs_map.items() if sub["has_live"]]
         if not live_uids:
-            return {}
+            return []
         try:
-            live_infos = await scheduler.live_platform.batch_get_status(live_uids)
-            return {str(info.uid): info.live_status == 1 for info in live_infos}
+            return await scheduler.live_platform.batch_get_status(live_uids)
         except Exception:
-            return {}
+            return []
 
     def _compose_rows(self, subs_map: dict, face_map: dict, live_status_map: dict):
         all_subs = []
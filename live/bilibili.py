@@ -1,6 +1,5 @@
 """Bilibili 直播平台实现"""
 
-from copy import deepcopy
 from enum import Enum, unique
 from typing import ClassVar
 
@@ -9,13 +8,16 @@ from pydantic import BaseModel, Field
 from ..core.compat import (
     PYDANTIC_V2,
     ConfigDict,
+    model_copy,
     type_validate_json,
     type_validate_python,
 )
+from ..core.http import HttpClient
 from ..core.network_retry import get_with_retry
 
 from ..core.platform import StatusChangePlatform
 from ..core.types import Category, Post, RawPost, Tag, Target
+from ..utils.json_codec import response_json
 from ..utils.logger import logger
 
 from ..core.models import UserAPI
@@ -29,6 +31,9 @@ class BilibiliLive(StatusChangePlatform):
         2: "标题更新提醒",
         3: "下播提醒",
     }
+    _cat_short: ClassVar[dict[Category, str]] = {
+        cat: name.replace("提醒", "") for cat, name in categories.items()
+    }
 
     @unique
     class LiveStatus(Enum):
@@ -46,11 +51,12 @@ class BilibiliLive(StatusChangePlatform):
 
     class Info(BaseModel):
         if PYDANTIC_V2:
-            model_config = ConfigDict(populate_by_name=True)
+            model_config = ConfigDict(populate_by_name=True, frozen=True)
         else:
 
             class Config:
                 allow_population_by_field_name = True
+                frozen = True
 
         title: str
         room_id: int
@@ -134,28 +140,18 @@ class BilibiliLive(StatusChangePlatform):
             "https://api.live.bilibili.com/room/v1/Room/get_status_info_by_uids",
             label=f"直播状态批量检查 {len(targets)} 个 UID",
             params={"uids[]": targets},
-            timeout=10.0,
         )
         if res.status_code in {403, 412}:
             return await self._retry_batch_after_risk(targets, res.status_code)
-        res_dict = res.json()
+        res_dict = response_json(res)
         if res_dict["code"] != 0:
             if str(res_dict["code"]) in {"-352", "352", "403", "412"}:
                 return await self._retry_batch_after_risk(targets, int(res_dict["code"]))
             raise Exception("API Error")
 
-        data = res_dict.get("data", {})
-        infos = []
-        for target in targets:
-            if target in data.keys():
-                infos.append(type_validate_python(self.Info, data[target]))
-            else:
-                infos.append(self._gen_empty_info(int(target)))
-        return infos
+        return self._infos_from_data(targets, res_dict.get("data"))
 
     async def _retry_batch_after_risk(self, targets: list[Target], status_code: int):
-        from ..core.http import HttpClient
-
         logger.warning(f"直播接口触发风控 ({status_code})，正在切换账号后重试...")
         if not await HttpClient.invalidate_current_account(status_code=status_code):
             raise Exception(f"Live API risk control: {status_code}")
@@ -165,25 +161,29 @@ class BilibiliLive(StatusChangePlatform):
             "https://api.live.bilibili.com/room/v1/Room/get_status_info_by_uids",
             label=f"直播风控切换账号后重试 {len(targets)} 个 UID",
             params={"uids[]": targets},
-            timeout=10.0,
         )
         if res.status_code in {403, 412}:
             await HttpClient.invalidate_current_account(status_code=res.status_code)
             raise Exception(f"Live API risk control after retry: {res.status_code}")
         res.raise_for_status()
-        res_dict = res.json()
+        res_dict = response_json(res)
         if res_dict["code"] != 0:
             if str(res_dict["code"]) in {"-352", "352", "403", "412"}:
                 await HttpClient.invalidate_current_account(
                     status_code=int(res_dict["code"])
                 )
             raise Exception(f"Live API Error after retry: {res_dict['code']}")
-        data = res_dict.get("data", {})
+        return self._infos_from_data(targets, res_dict.get("data"))
+
+    def _infos_from_data(self, targets: list[Target], data) -> list[Info]:
+        data = data or {}
+        keys = [str(target) for target in targets]
+        parsed = type_validate_python(
+            dict[str, self.Info], {key: data[key] for key in keys if key in data}
+        )
         return [
-            type_validate_python(self.Info, data[target])
-            if target in data.keys()
-            else self._gen_empty_info(int(target))
-            for target in targets
+            parsed[key] if key in parsed else self._gen_empty_info(int(key))
+            for key in keys
         ]
 
     def compare_status(
@@ -199,9 +199,7 @@ class BilibiliLive(StatusChangePlatform):
         return []
 
     def _gen_current_status(self, new_status: Info, category: int):
-        status = deepcopy(new_status)
-        status.category = Category(category)
-        return status
+        return model_copy(new_status, {"category": Category(category)})
 
     async def parse(self, raw_post: Info) -> Post:
         url = f"https://live.bilibili.com/{raw_post.room_id}"
@@ -210,7 +208,7 @@ class BilibiliLive(StatusChangePlatform):
             if raw_post.category == Category(1)
             else [raw_post.keyframe or raw_post.cover]
         )
-        cat_name = self.categories[raw_post.category].replace("提醒", "")
+        cat_name = self._cat_short[raw_post.category]
         title = f"[{cat_name}] {raw_post.title}"
 
         return Post(
@@ -62,6 +62,7 @@ class BilibiliPush(Star):
         self.request_delay_sec = config.request_delay_sec
         self.request_jitter_sec = config.request_jitter_sec
         self.live_batch_size = config.live_batch_size
+        self.dynamic_fetch_concurrency = config.dynamic_fetch_concurrency
         self.risk_cooldown_sec = config.risk_cooldown_sec
 
         self.enable_link_parser = config.enable_link_parser
@@ -90,6 +91,7 @@ class BilibiliPush(Star):
             request_delay_sec=self.request_delay_sec,
             request_jitter_sec=self.request_jitter_sec,
             live_batch_size=self.live_batch_size,
+            dynamic_fetch_concurrency=self.dynamic_fetch_concurrency,
             display_timezone=self.display_timezone,
             push_on_startup=self.push_on_startup,
             on_new_post=self._handle_new_post,
@@ -108,7 +110,6 @@ class BilibiliPush(Star):
         )
         self.login_handler = LoginHandler(
             context,
-            self.temp_dir,
             self.bg_dir,
             renderer=self.renderer,
         )
@@ -328,4 +329,5 @@ class BilibiliPush(Star):
 
     async def terminate(self):
         """插件终止时回收浏览器资源"""
+        self.login_handler.close()
         await self.runtime.stop()
@@ -1,44 +1,137 @@
+import asyncio
 import re
-from typing import Optional, Dict, Any
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Optional
 from ..core.http import HttpClient
 from ..core.network_retry import get_with_retry
+from ..utils.json_codec import response_json
 from ..utils.logger import logger
 from ..utils.timezone import format_bilibili_time
 
+_SHORT_LINK_CACHE_SIZE = 1024
+_short_link_cache: "OrderedDict[str, str]" = OrderedDict()
+
+_INFO_CACHE_SIZE = 512
+_INFO_CACHE_TTL_SEC = 300
+_LIVE_INFO_CACHE_TTL_SEC = 60
+_USER_INFO_CACHE_TTL_SEC = 6 * 3600
+_info_cache: "OrderedDict[tuple, tuple[float, dict]]" = OrderedDict()
+_info_inflight: "dict[tuple, asyncio.Future]" = {}
+_room_uid_cache: "OrderedDict[str, str]" = OrderedDict()
+
+
+LINK_PATTERN = re.compile(
+    r"(?P<bv>BV[0-9a-zA-Z]{10})"
+    r"|av(?P<av>\d+)"
+    r"|(?:t\.bilibili\.com|bilibili\.com/dynamic)/(?P<dynamic>\d+)"
+    r"|bilibili\.com/opus/(?P<opus>\d+)"
+    r"|live\.bilibili\.com/(?P<live>\d+)"
+)
+SHORT_LINK_PATTERN = re.compile(r"(b23\.tv/[A-Za-z\d]+)")
 
-class BilibiliParser:
-    BV_PATTERN = re.compile(r"(BV[0-9a-zA-Z]{10})")
-    AV_PATTERN = re.compile(r"av(\d+)")
-    DYNAMIC_PATTERN = re.compile(r"(?:t\.bilibili\.com|bilibili\.com/dynamic)/(\d+)")
-    OPUS_PATTERN = re.compile(r"bilibili\.com/opus/(\d+)")
-    LIVE_PATTERN = re.compile(r"live\.bilibili\.com/(\d+)")
-    SHORT_LINK_PATTERN = re.compile(r"(b23\.tv/[A-Za-z\d]+)")
 
+class BilibiliParser:
     def __init__(self, display_timezone: str = "Asia/Shanghai"):
         self.display_timezone = display_timezone
 
     async def parse_message(self, text: str) -> Optional[Dict[str, Any]]:
-        if m := self.SHORT_LINK_PATTERN.search(text):
-            url = f"https://{m.group(1)}"
-            try:
-                client = await HttpClient.get_client()
-                res = await client.head(url, follow_redirects=True, timeout=5.0)
-                text = str(res.url)
-            except Exception as e:
-                logger.debug(f"Follow short link failed: {e}")
-
-        if m := self.BV_PATTERN.search(text):
-            return await self.get_video_info(bvid=m.group(1))
-        if m := self.AV_PATTERN.search(text):
-            return await self.get_video_info(avid=m.group(1))
-        if m := self.DYNAMIC_PATTERN.search(text) or self.OPUS_PATTERN.search(text):
-            return await self.get_dynamic_info(m.group(1))
-        if m := self.LIVE_PATTERN.search(text):
-            return await self.get_live_info(m.group(1))
-        return None
+        if m := SHORT_LINK_PATTERN.search(text):
+            text = await self._resolve_short_link(m.group(1)) or text
+
+        m = LINK_PATTERN.search(text)
+        if not m:
+            return None
+        kind, value = m.lastgroup, m.group(m.lastgroup)
+        if kind == "bv":
+            return await self.get_video_info(bvid=value)
+        if kind == "av":
+            return await self.get_video_info(avid=value)
+        if kind in ("dynamic", "opus"):
+            return await self.get_dynamic_info(value)
+        return await self.get_live_info(value)
+
+    async def _resolve_short_link(self, short_link: str) -> str | None:
+        if location := _short_link_cache.get(short_link):
+            _short_link_cache.move_to_end(short_link)
+            return location
+        try:
+            client = await HttpClient.get_client()
+            res = await client.head(
+                f"https://{short_link}", follow_redirects=False, timeout=3.0
+            )
+            location = res.headers.get("location")
+        except Exception as e:
+            logger.debug(f"Follow short link failed: {e}")
+            return None
+        if not location:
+            return None
+        _short_link_cache[short_link] = location
+        if len(_short_link_cache) > _SHORT_LINK_CACHE_SIZE:
+            _short_link_cache.popitem(last=False)
+        return location
 
     async def get_video_info(
         self, bvid: str = None, avid: str = None
+    ) -> Optional[Dict[str, Any]]:
+        key = ("video", bvid) if bvid else ("video_av", avid)
+        return await self._cached_info(
+            key, _INFO_CACHE_TTL_SEC, lambda: self._fetch_video_info(bvid, avid)
+        )
+
+    async def get_dynamic_info(self, dynamic_id: str) -> Optional[Dict[str, Any]]:
+        return await self._cached_info(
+            ("dynamic", dynamic_id),
+            _INFO_CACHE_TTL_SEC,
+            lambda: self._fetch_dynamic_info(dynamic_id),
+        )
+
+    async def get_live_info(self, room_id: str) -> Optional[Dict[str, Any]]:
+        return await self._cached_info(
+            ("live", room_id),
+            _LIVE_INFO_CACHE_TTL_SEC,
+            lambda: self._fetch_live_info(room_id),
+        )
+
+    async def _cached_info(
+        self,
+        key: tuple,
+        ttl: float,
+        fetch: Callable[[], Awaitable[Optional[Dict[str, Any]]]],
+        serve_stale: bool = False,
+    ) -> Optional[Dict[str, Any]]:
+        cached = _info_cache.get(key)
+        if cached and cached[0] > time.monotonic():
+            _info_cache.move_to_end(key)
+            return dict(cached[1])
+
+        if future := _info_inflight.get(key):
+            result = await asyncio.shield(future)
+            if result:
+                return dict(result)
+            return dict(cached[1]) if serve_stale and cached else None
+
+        future = asyncio.get_running_loop().create_future()
+        _info_inflight[key] = future
+        result = None
+        try:
+            result = await fetch()
+        finally:
+            _info_inflight.pop(key, None)
+            future.set_result(result)
+
+        if result:
+            _info_cache[key] = (time.monotonic() + ttl, result)
+            _info_cache.move_to_end(key)
+            if len(_info_cache) > _INFO_CACHE_SIZE:
+                _info_cache.popitem(last=False)
+            return dict(result)
+        if serve_stale and cached:
+            return dict(cached[1])
+        return None
+
+    async def _fetch_video_info(
+        self, bvid: str = None, avid: str = None
     ) -> Optional[Dict[str, Any]]:
         client = await HttpClient.get_client()
         params = {"bvid": bvid} if bvid else {"aid": avid}
@@ -49,7 +142,7 @@ class BilibiliParser:
                 label=f"解析视频 {bvid or avid}",
                 params=params,
             )
-            data = res.json()
+            data = response_json(res)
             if data.get("code") == 0 and (v := data.get("data")):
                 return {
                     "type": "video",
@@ -76,7 +169,7 @@ class BilibiliParser:
             logger.error(f"解析视频链接失败: {e}")
         return None
 
-    async def get_dynamic_info(self, dynamic_id: str) -> Optional[Dict[str, Any]]:
+    async def _fetch_dynamic_info(self, dynamic_id: str) -> Optional[Dict[str, Any]]:
         client = await HttpClient.get_client()
         try:
             res = await get_with_retry(
@@ -85,7 +178,7 @@ class BilibiliParser:
                 label=f"解析动态 {dynamic_id}",
                 params={"id": dynamic_id, "features": "itemOpusStyle"},
             )
-            data = res.json()
+            data = response_json(res)
             if data.get("code") == 0 and (item := data.get("data", {}).get("item")):
                 modules = item.get("modules", {})
                 module_author = modules.get("module_author", {})
@@ -108,32 +201,31 @@ class BilibiliParser:
             logger.error(f"解析动态链接失败: {e}")
         return None
 
-    async def get_live_info(self, room_id: str) -> Optional[Dict[str, Any]]:
+    async def _fetch_live_info(self, room_id: str) -> Optional[Dict[str, Any]]:
         client = await HttpClient.get_client()
         try:
-            res = await get_with_retry(
+            known_uid = _room_uid_cache.get(room_id)
+            room_request = get_with_retry(
                 client,
                 "https://api.live.bilibili.com/room/v1/Room/get_info",
                 label=f"解析直播间 {room_id}",
                 params={"id": room_id},
             )
-            data = res.json()
+            if known_uid:
+                res, master = await asyncio.gather(
+                    room_request, self._fetch_live_master(client, known_uid)
+                )
+            else:
+                res, master = await room_request, None
+            data = response_json(res)
             if data.get("code") == 0 and (r := data.get("data")):
-                uid = r.get("uid")
-                nickname, avatar = "未知主播", ""
-                if uid:
-                    res_u = await get_with_retry(
-                        client,
-                        "https://api.live.bilibili.com/live_user/v1/Master/info",
-                        label=f"解析直播间主播 {uid}",
-                        params={"uid": uid},
-                    )
-                    u_info = res_u.json().get("data", {}).get("info")
-                    if u_info:
-                        nickname, avatar = (
-                            u_info.get("uname", nickname),
-                            u_info.get("face", avatar),
-                        )
+                uid = str(r.get("uid") or "")
+                if uid and uid != known_uid:
+                    _room_uid_cache[room_id] = uid
+                    if len(_room_uid_cache) > _SHORT_LINK_CACHE_SIZE:
+                        _room_uid_cache.popitem(last=False)
+                    master = await self._fetch_live_master(client, uid)
+                nickname, avatar = master or ("未知主播", "")
                 return {
                     "type": "live",
                     "title": r.get("title", ""),
@@ -147,7 +239,27 @@ class BilibiliParser:
             logger.error(f"解析直播链接失败: {e}")
         return None
 
+    async def _fetch_live_master(self, client, uid: str) -> tuple[str, str] | None:
+        res = await get_with_retry(
+            client,
+            "https://api.live.bilibili.com/live_user/v1/Master/info",
+            label=f"解析直播间主播 {uid}",
+            params={"uid": uid},
+        )
+        u_info = response_json(res).get("data", {}).get("info")
+        if not u_info:
+            return None
+        return u_info.get("uname", "未知主播"), u_info.get("face", "")
+
     async def get_user_info(self, uid: str) -> Optional[Dict[str, Any]]:
+        return await self._cached_info(
+            ("user", str(uid)),
+            _USER_INFO_CACHE_TTL_SEC,
+            lambda: self._fetch_user_info(uid),
+            serve_stale=True,
+        )
+
+    async def _fetch_user_info(self, uid: str) -> Optional[Dict[str, Any]]:
         client = await HttpClient.get_client()
         try:
             res = await get_with_retry(
@@ -157,7 +269,7 @@ class BilibiliParser:
                 params={"mid": uid},
                 timeout=5,
             )
-            data = res.json()
+            data = response_json(res)
             if data["code"] == 0:
                 card = data["data"]["card"]
                 return {"username": card["name"], "face": card["face"], "uid": uid}
@@ -165,7 +277,8 @@ class BilibiliParser:
             logger.error(f"获取用户信息失败: {e}")
         return None
 
-    def _dynamic_title(self, major: dict) -> str:
+    @staticmethod
+    def _dynamic_title(major: dict) -> str:
         if not isinstance(major, dict):
             return "B站动态"
         for key in ("archive", "article", "live", "opus"):
@@ -174,7 +287,8 @@ class BilibiliParser:
                 return title
         return "B站动态"
 
-    def _dynamic_description(self, major: dict) -> str:
+    @staticmethod
+    def _dynamic_description(major: dict) -> str:
         if not isinstance(major, dict):
             return ""
         article = major.get("article") or {}
@@ -184,7 +298,8 @@ class BilibiliParser:
         summary = opus.get("summary") or {}
         return summary.get("text", "")
 
-    def _dynamic_cover(self, major: dict) -> str:
+    @staticmethod
+    def _dynamic_cover(major: dict) -> str:
         if not isinstance(major, dict):
             return ""
         draw_items = (major.get("draw") or {}).get("items") or []
@@ -202,7 +317,8 @@ class BilibiliParser:
         live = major.get("live") or {}
         return live.get("cover", "")
 
-    def _format_duration(self, seconds: int) -> str:
+    @staticmethod
+    def _format_duration(seconds: int) -> str:
         m, s = divmod(seconds, 60)
         h, m = divmod(m, 60)
         return f"{h:d}:{m:02d}:{s:02d}" if h > 0 else f"{m:02d}:{s:02d}"
@@ -1,14 +1,23 @@
 from __future__ import annotations
 
+import asyncio
+import itertools
+import os
 import re
 import time
 from pathlib import Path
 
 from ..core.http import HttpClient
 from ..core.network_retry import get_with_retry
+from ..utils.json_codec import response_json
 from ..utils.logger import logger
 
 
+_WRITE_BATCH_BYTES = 1024 * 1024
+_CLEANUP_INTERVAL_SEC = 3600
+_download_seq = itertools.count()
+
+
 class BilibiliVideoDownloader:
     def __init__(
         self,
@@ -22,6 +31,7 @@ class BilibiliVideoDownloader:
         self.max_bytes = max(1, int(max_size_mb)) * 1024 * 1024
         self.timeout_sec = max(5, int(timeout_sec))
         self.quality = int(quality)
+        self._last_cleanup: float | None = None
 
     async def download_for_parse(self, info: dict) -> Path | None:
         if info.get("type") != "video":
@@ -33,7 +43,12 @@ class BilibiliVideoDownloader:
             return None
 
         self.download_dir.mkdir(parents=True, exist_ok=True)
-        self._cleanup_old_files()
+        if (
+            self._last_cleanup is None
+            or time.monotonic() - self._last_cleanup >= _CLEANUP_INTERVAL_SEC
+        ):
+            self._last_cleanup = time.monotonic()
+            await asyncio.to_thread(self._cleanup_old_files)
         target = self.download_dir / f"{_safe_name(bvid)}_{_safe_name(cid)}.mp4"
         if target.exists() and 0 < target.stat().st_size <= self.max_bytes:
             return target
@@ -67,9 +82,8 @@ class BilibiliVideoDownloader:
                 "fourk": 0,
             },
             headers={"Referer": referer},
-            timeout=10.0,
         )
-        data = response.json()
+        data = response_json(response)
         if data.get("code") != 0:
             logger.warning(f"获取视频下载直链失败: {data.get('message')}")
             return None
@@ -86,7 +100,9 @@ class BilibiliVideoDownloader:
 
     async def _download_url(self, url: str, target: Path, bvid: str) -> Path | None:
         client = await HttpClient.get_client()
-        temp_path = target.with_suffix(".download")
+        temp_path = target.with_name(
+            f"{target.stem}.{os.getpid()}.{next(_download_seq)}.download"
+        )
         downloaded = 0
         headers = {"Referer": f"https://www.bilibili.com/video/{bvid}"}
         try:
@@ -98,23 +114,29 @@ class BilibiliVideoDownloader:
             ) as response:
                 response.raise_for_status()
                 with temp_path.open("wb") as file:
+                    pending: list[bytes] = []
+                    pending_size = 0
                     async for chunk in response.aiter_bytes():
                         if not chunk:
                             continue
                         downloaded += len(chunk)
                         if downloaded > self.max_bytes:
                             raise ValueError("video exceeds size limit")
-                        file.write(chunk)
+                        pending.append(chunk)
+                        pending_size += len(chunk)
+                        if pending_size >= _WRITE_BATCH_BYTES:
+                            await asyncio.to_thread(file.write, b"".join(pending))
+                            pending, pending_size = [], 0
+                    if pending:
+                        await asyncio.to_thread(file.write, b"".join(pending))
             temp_path.replace(target)
             return target
         except Exception as exc:
             logger.warning(f"解析视频附件下载失败，已跳过: {exc}")
-            for path in (temp_path, target):
-                try:
-                    if path.exists():
-                        path.unlink()
-                except OSError:
-                    pass
+            try:
+                temp_path.unlink(missing_ok=True)
+            except OSError:
+                pass
             return None
 
     def _cleanup_old_files(self) -> None:
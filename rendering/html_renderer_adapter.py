@@ -23,3 +23,6 @@ class HtmlRendererAdapter(RendererPort):
             viewport=viewport,
             selector=selector,
         )
+
+    async def prewarm(self, template_name: str) -> None:
+        await self._renderer.prewarm(template_name)
@@ -11,3 +11,5 @@ class RendererPort(Protocol):
         viewport: dict | None = None,
         selector: str = "body",
     ) -> bytes: ...
+
+    async def prewarm(self, template_name: str) -> None: ...
@@ -15,12 +15,13 @@ class PostDispatcher:
         self.on_new_post = on_new_post
 
     async def dispatch(self, platform_name, posts, user_infos):
+        rendered: dict[int, list[MessageSegment]] = {}
         for user_info in user_infos:
             target_id = user_info.user_id
             for post in posts:
                 if not self._category_matches(post, user_info):
                     continue
-                await self._render_and_send(platform_name, target_id, post)
+                await self._render_and_send(platform_name, target_id, post, rendered)
 
     def _category_matches(self, post, user_info) -> bool:
         if post.category in user_info.categories:
@@ -31,11 +32,22 @@ class PostDispatcher:
             )
         return False
 
-    async def _render_and_send(self, platform_name, target_id, post):
+    async def _render_and_send(self, platform_name, target_id, post, rendered=None):
         try:
             logger.info(
                 f"  正在处理推送给 {target_id} | Platform: {post.platform} | Category: {post.category}"
             )
+            if not self.on_new_post:
+                logger.warning("  未配置推送回调 (on_new_post is None)，消息已丢弃")
+                return
+
+            msgs = rendered.get(id(post)) if rendered is not None else None
+            if msgs is not None:
+                logger.info("  复用本轮已渲染的推送消息")
+                await self.on_new_post(platform_name, target_id, list(msgs))
+                logger.info("  回调调用完成")
+                return
+
             theme = (
                 self.themes["movie_card"]
                 if post.platform == "bilibili-live"
@@ -45,15 +57,13 @@ class PostDispatcher:
                 logger.warning(f"  主题 {type(theme).__name__} 不支持渲染该推文，跳过")
                 return
 
-            if not self.on_new_post:
-                logger.warning("  未配置推送回调 (on_new_post is None)，消息已丢弃")
-                return
-
             logger.info(
                 f"  使用主题 {type(theme).__name__} 开始渲染并调用推送回调..."
             )
             msgs = await theme.render(post)
-            await self.on_new_post(platform_name, target_id, msgs)
+            if rendered is not None:
+                rendered[id(post)] = msgs
+            await self.on_new_post(platform_name, target_id, list(msgs))
             logger.info("  回调调用完成")
         except Exception as exc:
             logger.error(f"推送失败: {exc}")
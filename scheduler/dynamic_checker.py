@@ -6,42 +6,64 @@ from .subscription_group import group_subscriptions
 
 
 class DynamicSubscriptionChecker:
-    def __init__(self, platform, dispatcher, star=None, request_delay_sec: float = 1.5):
+    def __init__(
+        self,
+        platform,
+        dispatcher,
+        star=None,
+        request_delay_sec: float = 1.5,
+        fetch_concurrency: int = 1,
+    ):
         self.platform = platform
         self.dispatcher = dispatcher
         self.star = star
         self.request_delay_sec = max(0.0, float(request_delay_sec))
+        self.fetch_concurrency = max(1, int(fetch_concurrency))
         self.seen_posts: dict[str, set[str]] = {}
+        self._dirty_seen_uids: set[str] = set()
 
     async def check(self, subs: list[Subscription]):
-        sub_units = group_subscriptions(subs)
-        for index, sub_unit in enumerate(sub_units):
+        try:
+            await self._check_units(group_subscriptions(subs))
+        finally:
+            await self._flush_seen_posts()
+
+    async def _check_units(self, sub_units):
+        for index in range(0, len(sub_units), self.fetch_concurrency):
             if index:
                 await self._pause_between_requests()
-            uid = sub_unit.sub_target
-            try:
-                posts = await self.platform.fetch_new_post(sub_unit)
-                await self._load_seen_posts(uid)
+            group = sub_units[index:index + self.fetch_concurrency]
+            results = await asyncio.gather(
+                *(self.platform.fetch_new_post(sub_unit) for sub_unit in group),
+                return_exceptions=True,
+            )
+            for sub_unit, posts in zip(group, results):
+                uid = sub_unit.sub_target
+                try:
+                    if isinstance(posts, BaseException):
+                        raise posts
+                    await self._handle_posts(sub_unit, posts)
+                except Exception as exc:
+                    logger.error(f"动态检查失败 {uid}: {exc}")
+
+    async def _handle_posts(self, sub_unit, posts):
+        uid = sub_unit.sub_target
+        await self._load_seen_posts(uid)
 
-                if uid not in self.seen_posts:
-                    await self._init_seen_posts(uid, posts)
-                    continue
+        if uid not in self.seen_posts:
+            self._init_seen_posts(uid, posts)
+            return
 
-                new_posts = self._collect_new_posts(uid, posts)
-                self._trim_seen_posts(uid, posts)
+        new_posts = self._collect_new_posts(uid, posts)
+        self._trim_seen_posts(uid, posts)
 
-                if new_posts and self.star:
-                    await self.star.put_kv_data(
-                        f"seen_posts_{uid}", list(self.seen_posts[uid])
-                    )
-                if new_posts:
-                    await self.dispatcher.dispatch(
-                        self.platform.platform_name,
-                        new_posts,
-                        sub_unit.user_sub_infos,
-                    )
-            except Exception as exc:
-                logger.error(f"动态检查失败 {uid}: {exc}")
+        if new_posts:
+            self._dirty_seen_uids.add(uid)
+            await self.dispatcher.dispatch(
+                self.platform.platform_name,
+                new_posts,
+                sub_unit.user_sub_infos,
+            )
 
     async def _load_seen_posts(self, uid: str):
         if uid in self.seen_posts or not self.star:
@@ -50,10 +72,24 @@ class DynamicSubscriptionChecker:
         if cached:
             self.seen_posts[uid] = set(cached)
 
-    async def _init_seen_posts(self, uid: str, posts):
+    def _init_seen_posts(self, uid: str, posts):
         self.seen_posts[uid] = {post.id for post in posts}
-        if self.star:
-            await self.star.put_kv_data(f"seen_posts_{uid}", list(self.seen_posts[uid]))
+        self._dirty_seen_uids.add(uid)
+
+    async def _flush_seen_posts(self):
+        dirty, self._dirty_seen_uids = self._dirty_seen_uids, set()
+        if not dirty or not self.star:
+            return
+        results = await asyncio.gather(
+            *(
+                self.star.put_kv_data(f"seen_posts_{uid}", list(self.seen_posts[uid]))
+                for uid in dirty
+            ),
+            return_exceptions=True,
+        )
+        for uid, result in zip(dirty, results):
+            if isinstance(result, Exception):
+                logger.error(f"保存动态去重缓存失败 {uid}: {result}")
 
     def _collect_new_posts(self, uid: str, posts):
         new_posts = []
@@ -75,7 +75,7 @@ class LiveSubscriptionChecker:
         )
 
     async def manual_check(self, target_id: str) -> int:
-        subs = self.db.get_enabled_subscriptions(target_id)
+        subs = await asyncio.to_thread(self.db.get_enabled_subscriptions, target_id)
         live_subs = [sub for sub in subs if sub.sub_type == "live"]
         live_uids = len(group_subscriptions(live_subs))
         logger.info(f"手动直播检查开始 | Target: {target_id} | LiveUIDs: {live_uids}")
@@ -86,11 +86,8 @@ class LiveSubscriptionChecker:
         return pushed
 
     async def manual_check_all(self) -> tuple[int, int]:
-        live_subs = [
-            sub
-            for sub in self.db.get_enabled_subscriptions()
-            if sub.sub_type == "live"
-        ]
+        subs = await asyncio.to_thread(self.db.get_enabled_subscriptions)
+        live_subs = [sub for sub in subs if sub.sub_type == "live"]
         targets = {sub.target_id for sub in live_subs}
         live_uids = len(group_subscriptions(live_subs))
         logger.info(
@@ -29,6 +29,7 @@ class BilibiliScheduler:
         request_delay_sec: float = 1.5,
         request_jitter_sec: float = 30.0,
         live_batch_size: int = 50,
+        dynamic_fetch_concurrency: int = 1,
         display_timezone: str = "Asia/Shanghai",
         push_on_startup: bool = False,
         on_new_post: Callable[[str, str, list[MessageSegment]], Awaitable[None]]
@@ -56,6 +57,7 @@ class BilibiliScheduler:
             self.dispatcher,
             star=self.star,
             request_delay_sec=request_delay_sec,
+            fetch_concurrency=dynamic_fetch_concurrency,
         )
         self.live_checker = LiveSubscriptionChecker(
             db=self.db,
@@ -143,13 +145,13 @@ class BilibiliScheduler:
         await self._check_live()
 
     async def _check_dynamic(self):
-        subs = self.db.get_enabled_subscriptions()
+        subs = await asyncio.to_thread(self.db.get_enabled_subscriptions)
         dyn_subs = [sub for sub in subs if sub.sub_type == "dynamic"]
         if dyn_subs:
             await self.dynamic_checker.check(dyn_subs)
 
     async def _check_live(self):
-        subs = self.db.get_enabled_subscriptions()
+        subs = await asyncio.to_thread(self.db.get_enabled_subscriptions)
         live_subs = [sub for sub in subs if sub.sub_type == "live"]
         if live_subs:
             await self.live_checker.check(live_subs)
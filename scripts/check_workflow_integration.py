@@ -215,7 +215,7 @@ def _check_runtime_guards() -> None:
         ROOT / "handlers" / "subscription_list.py",
     ):
         source = path.read_text(encoding="utf-8")
-        if "fetch_avatar_map" not in source:
+        if "fetch_avatar_map" not in source and "fetch_faces_with_live" not in source:
             raise SystemExit(f"avatar cache is not used by {path.relative_to(ROOT)}")
 
 
@@ -0,0 +1,23 @@
+import base64
+
+try:
+    import pybase64
+except ImportError:
+    pybase64 = None
+
+
+if pybase64 is not None:
+
+    def b64encode_str(data: bytes | memoryview) -> str:
+        return pybase64.b64encode_as_string(data)
+
+    def b64decode(data: str | bytes) -> bytes:
+        return pybase64.b64decode(data)
+
+else:
+
+    def b64encode_str(data: bytes | memoryview) -> str:
+        return base64.b64encode(data).decode("ascii")
+
+    def b64decode(data: str | bytes) -> bytes:
+        return base64.b64decode(data)
@@ -1,3 +1,4 @@
+from functools import lru_cache
 from pathlib import Path
 import asyncio
 import time
@@ -238,6 +239,20 @@ async def _register_internal_font_routes(page: Page) -> None:
         await page.route(url, fulfill_font)
 
 
+@lru_cache(maxsize=4)
+def _jinja_env(template_path: str) -> jinja2.Environment:
+    env = jinja2.Environment(
+        loader=jinja2.FileSystemLoader(template_path),
+        enable_async=True,
+        autoescape=jinja2.select_autoescape(["html", "xml"]),
+    )
+    env.globals.update(
+        internal_font_face_css=get_internal_font_face_css(),
+        internal_font_family=get_internal_font_family(),
+    )
+    return env
+
+
 async def render_template(
     template_path: Path,
     template_name: str,
@@ -249,16 +264,9 @@ async def render_template(
     if viewport is None:
         viewport = {"width": 800, "height": 600}
 
-    env = jinja2.Environment(
-        loader=jinja2.FileSystemLoader(str(template_path)),
-        enable_async=True,
-        autoescape=jinja2.select_autoescape(["html", "xml"]),
-    )
-    env.globals.update(
-        internal_font_face_css=get_internal_font_face_css(),
-        internal_font_family=get_internal_font_family(),
+    template = await asyncio.to_thread(
+        _jinja_env(str(template_path)).get_template, template_name
     )
-    template = env.get_template(template_name)
     html_content = await template.render_async(**templates)
 
     async with _RENDER_SEMAPHORE:
@@ -308,6 +316,15 @@ class HtmlRenderer:
         self.template_path = template_path
         self.avatar_cache_dir = avatar_cache_dir
 
+    async def prewarm(self, template_name: str) -> None:
+        """提前加载并编译模板，首次渲染时不再承担 Jinja 编译开销。"""
+        try:
+            await asyncio.to_thread(
+                _jinja_env(str(self.template_path)).get_template, template_name
+            )
+        except Exception as exc:
+            logger.debug(f"[{template_name}] 模板预热失败: {exc}")
+
     async def render(
         self,
         template_name: str,
@@ -1,18 +1,20 @@
 from __future__ import annotations
 
 import asyncio
-import base64
 import hashlib
 import io
 import json
 import time
 import urllib.request
+from collections import OrderedDict
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
 from PIL import Image
 
+from .base64_codec import b64decode, b64encode_str
+from .json_codec import dumps as json_dumps, loads as json_loads
 from .logger import logger
 
 
@@ -21,6 +23,7 @@ _DEFAULT_MAX_SOURCE_BYTES = 16 * 1024 * 1024
 AVATAR_IMAGE_CACHE_TTL_SEC = 24 * 3600
 IMAGE_CACHE_UNUSED_RETENTION_SEC = 120 * 24 * 3600
 _IMAGE_CACHE_CLEANUP_INTERVAL_SEC = 24 * 3600
+_MEMORY_CACHE_SIZE = 256
 _AVATAR_FIELD_NAMES = {"avatar", "face"}
 _USER_AGENT = (
     "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
@@ -71,6 +74,12 @@ class ImageTooLarge(ValueError):
     pass
 
 
+_memory_cache: "OrderedDict[tuple[str, ImageOptimizePolicy], tuple[float, str]]" = (
+    OrderedDict()
+)
+_last_cleanup: dict[Path, float] = {}
+
+
 async def optimize_template_image(
     image: Any,
     policy: ImageOptimizePolicy,
@@ -86,7 +95,9 @@ async def optimize_template_image(
     cache_path = Path(cache_dir) if cache_dir else None
     stale_cached = ""
     if cache_path and _is_cacheable_image(image):
-        cached = await asyncio.to_thread(
+        if cached := _memory_cached_image(image, policy, cache_ttl_sec):
+            return cached
+        cached, created_at = await asyncio.to_thread(
             _read_cached_image,
             cache_path,
             image,
@@ -96,8 +107,9 @@ async def optimize_template_image(
             False,
         )
         if cached:
+            _remember_image(image, policy, cached, created_at)
             return cached
-        stale_cached = await asyncio.to_thread(
+        stale_cached, _ = await asyncio.to_thread(
             _read_cached_image,
             cache_path,
             image,
@@ -110,6 +122,7 @@ async def optimize_template_image(
     try:
         optimized = await asyncio.to_thread(_optimize_template_image_sync, image, policy)
         if cache_path and _is_cacheable_result(optimized):
+            _remember_image(image, policy, optimized, time.time())
             await asyncio.to_thread(
                 _write_cached_image,
                 cache_path,
@@ -152,6 +165,8 @@ async def localize_template_avatar_images(
 def _optimize_template_image_sync(image: Any, policy: ImageOptimizePolicy) -> str:
     raw = _load_image_bytes(image, policy)
     with Image.open(io.BytesIO(raw)) as source:
+        if source.format == "JPEG" and (target := _target_size(source.size, policy)):
+            source.draft("RGB", target)
         source.load()
         resized = _resize_image(source, policy)
         return _encode_image_data_uri(resized, policy)
@@ -166,7 +181,7 @@ def _load_image_bytes(image: Any, policy: ImageOptimizePolicy) -> bytes:
         header, _, payload = image.partition(",")
         if ";base64" not in header or not payload:
             raise ValueError("unsupported image data URI")
-        return base64.b64decode(payload)
+        return b64decode(payload)
     if image.startswith(("http://", "https://")):
         request = urllib.request.Request(
             image,
@@ -186,9 +201,10 @@ def _load_image_bytes(image: Any, policy: ImageOptimizePolicy) -> bytes:
     raise ValueError("only http(s), bytes, and image data URI are supported")
 
 
-def _resize_image(source: Image.Image, policy: ImageOptimizePolicy) -> Image.Image:
-    image = source.convert("RGB")
-    width, height = image.size
+def _target_size(
+    size: tuple[int, int], policy: ImageOptimizePolicy
+) -> tuple[int, int] | None:
+    width, height = size
     scale = min(
         1.0,
         policy.max_width / max(width, 1),
@@ -196,12 +212,16 @@ def _resize_image(source: Image.Image, policy: ImageOptimizePolicy) -> Image.Ima
         (policy.max_pixels / max(width * height, 1)) ** 0.5,
     )
     if scale >= 1.0:
+        return None
+    return max(1, int(width * scale)), max(1, int(height * scale))
+
+
+def _resize_image(source: Image.Image, policy: ImageOptimizePolicy) -> Image.Image:
+    image = source.convert("RGB")
+    target_size = _target_size(image.size, policy)
+    if target_size is None:
         return image
-    target_size = (
-        max(1, int(width * scale)),
-        max(1, int(height * scale)),
-    )
-    return image.resize(target_size, Image.Resampling.LANCZOS)
+    return image.resize(target_size, Image.Resampling.LANCZOS, reducing_gap=3.0)
 
 
 def _encode_image_data_uri(image: Image.Image, policy: ImageOptimizePolicy) -> str:
@@ -211,9 +231,16 @@ def _encode_image_data_uri(image: Image.Image, policy: ImageOptimizePolicy) -> s
         mime = "image/webp"
     except Exception:
         out = io.BytesIO()
-        image.save(out, format="JPEG", quality=policy.quality, optimize=True)
+        image.save(
+            out,
+            format="JPEG",
+            quality=policy.quality,
+            optimize=True,
+            progressive=True,
+            subsampling=2,
+        )
         mime = "image/jpeg"
-    return f"data:{mime};base64,{base64.b64encode(out.getvalue()).decode('ascii')}"
+    return f"data:{mime};base64,{b64encode_str(out.getbuffer())}"
 
 
 async def _localize_avatar_value(value: Any, cache_dir: Path, key_name: str) -> Any:
@@ -239,6 +266,31 @@ async def _localize_avatar_value(value: Any, cache_dir: Path, key_name: str) ->
     return value
 
 
+def _memory_cached_image(
+    image: str, policy: ImageOptimizePolicy, cache_ttl_sec: int
+) -> str:
+    key = (image, policy)
+    hit = _memory_cache.get(key)
+    if not hit:
+        return ""
+    created_at, data_uri = hit
+    if cache_ttl_sec > 0 and time.time() - created_at > cache_ttl_sec:
+        _memory_cache.pop(key, None)
+        return ""
+    _memory_cache.move_to_end(key)
+    return data_uri
+
+
+def _remember_image(
+    image: str, policy: ImageOptimizePolicy, data_uri: str, created_at: float
+) -> None:
+    key = (image, policy)
+    _memory_cache[key] = (created_at, data_uri)
+    _memory_cache.move_to_end(key)
+    if len(_memory_cache) > _MEMORY_CACHE_SIZE:
+        _memory_cache.popitem(last=False)
+
+
 def _is_cacheable_image(image: Any) -> bool:
     return isinstance(image, str) and image.startswith(("http://", "https://"))
 
@@ -254,35 +306,35 @@ def _read_cached_image(
     cache_ttl_sec: int,
     cache_unused_retention_sec: int,
     allow_expired: bool,
-) -> str:
+) -> tuple[str, float]:
     _cleanup_image_cache(cache_dir, cache_unused_retention_sec)
     data_path, meta_path = _cached_image_paths(cache_dir, image, policy)
     if not data_path.exists() or not meta_path.exists():
-        return ""
+        return "", 0.0
 
     now = time.time()
     try:
-        meta = json.loads(meta_path.read_text(encoding="utf-8"))
+        meta = json_loads(meta_path.read_bytes())
     except Exception:
         _delete_cached_image(data_path, meta_path)
-        return ""
+        return "", 0.0
 
     created_at = float(meta.get("created_at") or 0)
     if cache_ttl_sec > 0 and now - created_at > cache_ttl_sec and not allow_expired:
-        return ""
+        return "", 0.0
 
     try:
         data_uri = data_path.read_text(encoding="utf-8")
     except Exception:
         _delete_cached_image(data_path, meta_path)
-        return ""
+        return "", 0.0
     if not data_uri.startswith("data:image/"):
         _delete_cached_image(data_path, meta_path)
-        return ""
+        return "", 0.0
 
     meta["last_used_at"] = now
     _write_json(meta_path, meta)
-    return data_uri
+    return data_uri, created_at
 
 
 def _write_cached_image(
@@ -339,10 +391,13 @@ def _policy_fingerprint(policy: ImageOptimizePolicy) -> dict[str, int]:
 def _cleanup_image_cache(cache_dir: Path, unused_retention_sec: int) -> None:
     now = time.time()
     marker = cache_dir / ".last_cleanup"
-    try:
-        last_cleanup = float(marker.read_text(encoding="utf-8"))
-    except Exception:
-        last_cleanup = 0
+    last_cleanup = _last_cleanup.get(cache_dir)
+    if last_cleanup is None:
+        try:
+            last_cleanup = float(marker.read_text(encoding="utf-8"))
+        except Exception:
+            last_cleanup = 0
+        _last_cleanup[cache_dir] = last_cleanup
     if now - last_cleanup < _IMAGE_CACHE_CLEANUP_INTERVAL_SEC:
         return
 
@@ -351,7 +406,7 @@ def _cleanup_image_cache(cache_dir: Path, unused_retention_sec: int) -> None:
     for meta_path in cache_dir.glob("*.json"):
         data_path = meta_path.with_suffix(".txt")
         try:
-            meta = json.loads(meta_path.read_text(encoding="utf-8"))
+            meta = json_loads(meta_path.read_bytes())
             last_used_at = float(meta.get("last_used_at") or 0)
         except Exception:
             last_used_at = 0
@@ -364,6 +419,7 @@ def _cleanup_image_cache(cache_dir: Path, unused_retention_sec: int) -> None:
         if not data_path.with_suffix(".json").exists():
             data_path.unlink(missing_ok=True)
     marker.write_text(str(now), encoding="utf-8")
+    _last_cleanup[cache_dir] = now
 
 
 def _delete_cached_image(data_path: Path, meta_path: Path) -> None:
@@ -372,7 +428,4 @@ def _delete_cached_image(data_path: Path, meta_path: Path) -> None:
 
 
 def _write_json(path: Path, data: dict) -> None:
-    path.write_text(
-        json.dumps(data, ensure_ascii=False, separators=(",", ":")),
-        encoding="utf-8",
-    )
+    path.write_text(json_dumps(data), encoding="utf-8")
@@ -0,0 +1,27 @@
+import json
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+if orjson is not None:
+
+    def loads(data: str | bytes):
+        return orjson.loads(data)
+
+    def dumps(obj) -> str:
+        return orjson.dumps(obj).decode("utf-8")
+
+else:
+
+    def loads(data: str | bytes):
+        return json.loads(data)
+
+    def dumps(obj) -> str:
+        return json.dumps(obj, ensure_ascii=False, separators=(",", ":"))
+
+
+def response_json(response):
+    return loads(response.content)
@@ -1,5 +1,7 @@
 """AstrBot logger 适配器。"""
 
+from types import SimpleNamespace
+
 try:
     from astrbot.api import logger as astrbot_logger
 except ImportError:
@@ -9,36 +11,29 @@ except ImportError:
     astrbot_logger = logging.getLogger("astrbot_mock")
 
 
-class LoggerAdapter:
-    @staticmethod
-    def info(message: str, *args, **kwargs):
-        astrbot_logger.info(message)
-
-    @staticmethod
-    def debug(message: str, *args, **kwargs):
-        astrbot_logger.debug(message)
-
-    @staticmethod
-    def trace(message: str, *args, **kwargs):
-        astrbot_logger.debug(message)
+info = astrbot_logger.info
+debug = astrbot_logger.debug
+trace = astrbot_logger.debug
+warning = astrbot_logger.warning
+error = astrbot_logger.error
 
-    @staticmethod
-    def warning(message: str, *args, **kwargs):
-        astrbot_logger.warning(message)
 
-    @staticmethod
-    def error(message: str, *args, **kwargs):
-        astrbot_logger.error(message)
+def exception(message: str, *args, **kwargs):
+    astrbot_logger.error(message, exc_info=True)
 
-    @staticmethod
-    def exception(message: str, *args, **kwargs):
-        astrbot_logger.error(message, exc_info=True)
 
-    @staticmethod
-    def success(message: str, *args, **kwargs):
-        astrbot_logger.info(f"✓ {message}")
+def success(message: str, *args, **kwargs):
+    astrbot_logger.info(f"✓ {message}")
 
 
-logger = LoggerAdapter()
+logger = SimpleNamespace(
+    info=info,
+    debug=debug,
+    trace=trace,
+    warning=warning,
+    error=error,
+    exception=exception,
+    success=success,
+)
 
 __all__ = ["logger"]
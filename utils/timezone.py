@@ -1,10 +1,12 @@
 import re
 from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
 
 DEFAULT_TIMEZONE_NAME = "Asia/Shanghai"
 
 
+@lru_cache(maxsize=32)
 def get_display_timezone(name: str | None = DEFAULT_TIMEZONE_NAME):
     timezone_name = str(name or DEFAULT_TIMEZONE_NAME).strip() or DEFAULT_TIMEZONE_NAME
     offset_minutes = _parse_utc_offset(timezone_name)
@@ -40,10 +42,20 @@ def format_bilibili_time(
         return ""
     if value <= 0:
         return ""
-    return datetime.fromtimestamp(
-        value,
-        tz=get_display_timezone(timezone_name),
-    ).strftime(fmt)
+    return _format_timestamp(value, fmt, timezone_name)
+
+
+@lru_cache(maxsize=1024)
+def _format_timestamp(value: int, fmt: str, timezone_name: str | None) -> str:
+    dt = datetime.fromtimestamp(value, tz=get_display_timezone(timezone_name))
+    if fmt == "%Y-%m-%d %H:%M:%S":
+        return (
+            f"{dt.year:04d}-{dt.month:02d}-{dt.day:02d} "
+            f"{dt.hour:02d}:{dt.minute:02d}:{dt.second:02d}"
+        )
+    if fmt == "%Y-%m-%d %H:%M":
+        return f"{dt.year:04d}-{dt.month:02d}-{dt.day:02d} {dt.hour:02d}:{dt.minute:02d}"
+    return dt.strftime(fmt)
 
 
 def _parse_utc_offset(value: str) -> int | None:
@@ -1,11 +1,11 @@
 from __future__ import annotations
 
-import base64
-import io
-
-import qrcode
+import asyncio
 
 from ..core.http import HttpClient
+from ..core.utils import qr_png
+from ..utils.base64_codec import b64encode_str
+from ..utils.json_codec import response_json
 from .manager_response import error, ok
 
 
@@ -17,7 +17,7 @@ class AccountQrLoginService:
                 "https://passport.bilibili.com/x/passport-login/web/qrcode/generate",
                 timeout=8,
             )
-            body = res.json()
+            body = response_json(res)
             data = body.get("data") or {}
             url = str(data.get("url") or "")
             qrcode_key = str(data.get("qrcode_key") or "")
@@ -31,7 +31,7 @@ class AccountQrLoginService:
             {
                 "qrcode_key": qrcode_key,
                 "url": url,
-                "image": qr_data_url(url),
+                "image": await asyncio.to_thread(qr_data_url, url),
                 "status": "pending",
                 "message": "请使用 B 站 App 扫码登录。",
             }
@@ -49,7 +49,7 @@ class AccountQrLoginService:
                 params={"qrcode_key": qrcode_key},
                 timeout=8,
             )
-            data = (res.json().get("data") or {})
+            data = (response_json(res).get("data") or {})
         except Exception as exc:
             return error(f"二维码状态检查失败: {exc}")
 
@@ -78,7 +78,7 @@ async def save_qr_account(client, data: dict, cookies: dict) -> dict:
             cookies=cookies,
             timeout=5,
         )
-        nav_data = nav_res.json()
+        nav_data = response_json(nav_res)
         if nav_data.get("code") == 0:
             nav = nav_data.get("data") or {}
             uid = str(nav.get("mid") or uid)
@@ -92,11 +92,4 @@ async def save_qr_account(client, data: dict, cookies: dict) -> dict:
 
 
 def qr_data_url(url: str) -> str:
-    qr = qrcode.QRCode(version=1, box_size=8, border=4)
-    qr.add_data(url)
-    qr.make(fit=True)
-    img = qr.make_image(fill_color="black", back_color="white")
-    buf = io.BytesIO()
-    img.save(buf, format="PNG")
-    encoded = base64.b64encode(buf.getvalue()).decode("ascii")
-    return f"data:image/png;base64,{encoded}"
+    return f"data:image/png;base64,{b64encode_str(qr_png(url, scale=8, border=4))}"
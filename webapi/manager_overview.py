@@ -1,8 +1,6 @@
 from __future__ import annotations
 
-import asyncio
-
-from ..core.avatar_cache import fetch_avatar_map
+from ..core.avatar_cache import fetch_faces_with_live
 from ..core.http import HttpClient
 from .manager_serializers import (
     NO_FACE,
@@ -81,29 +79,28 @@ class ManagerOverviewService:
 
     async def _enrich_subscriptions(self, subscriptions: list[dict]) -> list[dict]:
         uids = sorted({sub["uid"] for sub in subscriptions if sub.get("uid")})
-        face_map, live_status_map = await asyncio.gather(
-            self._fetch_face_map(uids),
-            self._fetch_live_status_map(subscriptions),
+        live_uids = {
+            sub["uid"] for sub in subscriptions if sub.get("sub_type") == "live"
+        }
+        live_infos, face_map = await fetch_faces_with_live(
+            self.plugin, uids, live_uids, self._fetch_live_infos(subscriptions)
         )
+        live_status_map = {str(info.uid): info.live_status == 1 for info in live_infos}
         for sub in subscriptions:
             uid = sub.get("uid") or ""
             sub["face"] = face_map.get(uid, NO_FACE)
             sub["is_live"] = live_status_map.get(uid, False)
         return subscriptions
 
-    async def _fetch_face_map(self, uids: list[str]) -> dict[str, str]:
-        return await fetch_avatar_map(self.plugin, uids)
-
-    async def _fetch_live_status_map(self, subscriptions: list[dict]) -> dict[str, bool]:
+    async def _fetch_live_infos(self, subscriptions: list[dict]) -> list:
         live_uids = sorted({
             sub["uid"]
             for sub in subscriptions
             if sub.get("uid") and sub.get("sub_type") == "live"
         })
         if not live_uids:
-            return {}
+            return []
         try:
-            live_infos = await self.plugin.scheduler.live_platform.batch_get_status(live_uids)
-            return {str(info.uid): info.live_status == 1 for info in live_infos}
+            return await self.plugin.scheduler.live_platform.batch_get_status(live_uids)
         except Exception:
-            return {}
+            return []
@@ -2,11 +2,16 @@ from __future__ import annotations
 
 import json
 import time
+from collections import OrderedDict
 
 from ..core.http import HttpClient
+from ..utils.json_codec import response_json
 
 
 NO_FACE = "http://i0.hdslb.com/bfs/face/member/noface.jpg"
+_USER_INFO_TTL_SEC = 600
+_USER_INFO_CACHE_SIZE = 256
+_user_info_cache: OrderedDict[str, tuple[float, dict]] = OrderedDict()
 
 
 def serialize_subscription(sub) -> dict:
@@ -81,6 +86,11 @@ def serialize_pending_task(task: dict) -> dict:
 
 
 async def fetch_user_info(uid: str) -> dict:
+    cached = _user_info_cache.get(uid)
+    if cached and time.monotonic() - cached[0] < _USER_INFO_TTL_SEC:
+        _user_info_cache.move_to_end(uid)
+        return dict(cached[1])
+
     client = await HttpClient.get_client()
     try:
         res = await client.get(
@@ -88,13 +98,18 @@ async def fetch_user_info(uid: str) -> dict:
             params={"mid": uid},
             timeout=5,
         )
-        data = res.json()
+        data = response_json(res)
         if data.get("code") == 0:
             card = data.get("data", {}).get("card", {})
-            return {
+            info = {
                 "username": str(card.get("name") or ""),
                 "face": str(card.get("face") or ""),
             }
+            _user_info_cache[uid] = (time.monotonic(), info)
+            _user_info_cache.move_to_end(uid)
+            while len(_user_info_cache) > _USER_INFO_CACHE_SIZE:
+                _user_info_cache.popitem(last=False)
+            return dict(info)
     except Exception:
         pass
     return {}
@@ -4,6 +4,7 @@ import re
 from dataclasses import dataclass, field
 from typing import Any
 
+from .branch_readonly import build_readonly_branches, list_branch
 from .utils import first_text, normalize_sub_type, normalize_workflow
 
 
@@ -58,8 +59,6 @@ def build_dispatch_branches(
     sub_type = _subscription_type(raw, params)
     branches: list[DispatchBranch] = []
 
-    from .branch_readonly import build_readonly_branches, list_branch
-
     branches.extend(build_readonly_branches(DispatchBranch, raw, params, query))
     if _wants_list(raw):
         list_sub_type = _list_sub_type(raw, params)
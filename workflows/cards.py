@@ -1,12 +1,13 @@
 from __future__ import annotations
 
-import asyncio
 import time
 from collections.abc import Iterable
 
-from ..core.avatar_cache import NO_FACE, fetch_avatar_map
+from ..core.avatar_cache import NO_FACE, fetch_faces_with_live
 from .results import WorkflowCard
 
+SUBSCRIPTION_CHANGE_TEMPLATE = "sub_add.html.jinja"
+
 
 def candidate_list_card(
     candidates: list[dict],
@@ -63,10 +64,13 @@ async def subscription_list_card(plugin, subscriptions: Iterable) -> WorkflowCar
         elif sub.sub_type == "live":
             subs_map[sub.uid]["has_live"] = True
 
-    face_map, live_map = await asyncio.gather(
-        _fetch_face_map(plugin, subs_map.keys()),
-        _fetch_live_status_map(plugin, subs_map.values()),
+    live_infos, face_map = await fetch_faces_with_live(
+        plugin,
+        subs_map.keys(),
+        [uid for uid, item in subs_map.items() if item["has_live"]],
+        _fetch_live_infos(plugin, subs_map.values()),
     )
+    live_map = {str(info.uid): info.live_status == 1 for info in live_infos}
     rows = []
     for uid, item in subs_map.items():
         rows.append({
@@ -111,7 +115,7 @@ def subscription_change_card(
     action: str,
 ) -> WorkflowCard:
     return WorkflowCard(
-        template_name="sub_add.html.jinja",
+        template_name=SUBSCRIPTION_CHANGE_TEMPLATE,
         templates={
             "username": username,
             "face": face or NO_FACE,
@@ -213,16 +217,11 @@ def _account_cooling(account: dict) -> bool:
     return int(account.get("cooldown_until") or 0) > int(time.time())
 
 
-async def _fetch_face_map(plugin, uids) -> dict[str, str]:
-    return await fetch_avatar_map(plugin, uids)
-
-
-async def _fetch_live_status_map(plugin, rows: Iterable[dict]) -> dict[str, bool]:
+async def _fetch_live_infos(plugin, rows: Iterable[dict]) -> list:
     live_uids = [str(row["uid"]) for row in rows if row.get("has_live")]
     if not live_uids:
-        return {}
+        return []
     try:
-        live_infos = await plugin.scheduler.live_platform.batch_get_status(live_uids)
-        return {str(info.uid): info.live_status == 1 for info in live_infos}
+        return await plugin.scheduler.live_platform.batch_get_status(live_uids)
     except Exception:
-        return {}
+        return []
@@ -10,6 +10,7 @@ from .models import (
     REMOVE_CONFIRM_REPLIES,
     WorkflowRequest,
 )
+from .entity_resolver import learn_up_alias
 from .markers import decode_task_marker
 from .runtime import event_message_text, event_origin, event_text_bundle
 from .utils import normalize_reply
@@ -111,8 +112,6 @@ async def _continue_candidates(
     if task.get("mode") != "add_subscription":
         alias = str(task.get("keyword") or "").strip()
         if alias:
-            from .entity_resolver import learn_up_alias
-
             learn_up_alias(plugin, event, alias, candidate, source="search_selection")
         return f"已选择：{candidate.get('username')} | UID={candidate.get('uid')}"
 
@@ -138,8 +137,6 @@ async def _continue_candidates(
         )
         alias = str(task.get("keyword") or "").strip()
         if alias:
-            from .entity_resolver import learn_up_alias
-
             learn_up_alias(plugin, event, alias, candidate, source="search_selection")
         return result
     return await build_confirm_task(plugin, event, next_request, candidate)
@@ -169,8 +166,6 @@ async def _continue_add_confirm(
     result = await add_subscription_by_uid(plugin, event, uid, sub_type)
     alias = _alias_from_confirm_task(task)
     if alias:
-        from .entity_resolver import learn_up_alias
-
         learn_up_alias(plugin, event, alias, candidate)
     return result
 
@@ -1,9 +1,13 @@
 from __future__ import annotations
 
+import time
+from collections import OrderedDict
+
 from astrbot.api import logger
 
 from ..core.http import HttpClient
 from ..core.network_retry import get_with_retry
+from ..utils.json_codec import response_json
 from .candidate_analysis import analyze_search_candidates
 from .cards import candidate_list_card
 from .entity_resolver import resolve_up_reference
@@ -14,11 +18,37 @@ from .resolver_stats import record_resolver_event
 from .results import WorkflowResult
 from .utils import clean_html_text, first_text
 
+_SEARCH_CACHE_SIZE = 256
+_search_cache: "OrderedDict[tuple[str, int], tuple[float, list[dict]]]" = OrderedDict()
+
+
+def search_cache_ttl_sec(plugin) -> float:
+    return max(0, int(getattr(plugin, "search_cache_expiry_hours", 0) or 0)) * 3600
+
 
-async def search_up_candidates(keyword: str, limit: int = 8) -> tuple[list[dict], str]:
+def invalidate_search_cache(uid: str) -> None:
+    uid = str(uid)
+    stale = [
+        key
+        for key, (_, candidates) in _search_cache.items()
+        if any(item["uid"] == uid for item in candidates)
+    ]
+    for key in stale:
+        del _search_cache[key]
+
+
+async def search_up_candidates(
+    keyword: str, limit: int = 8, cache_ttl_sec: float = 0
+) -> tuple[list[dict], str]:
     if not keyword.strip():
         return [], "搜索关键词不能为空。"
 
+    cache_key = (keyword.strip().lower(), limit)
+    cached = _search_cache.get(cache_key)
+    if cache_ttl_sec > 0 and cached and cached[0] > time.monotonic():
+        _search_cache.move_to_end(cache_key)
+        return [dict(item) for item in cached[1]], ""
+
     client = await HttpClient.get_client()
     try:
         response = await get_with_retry(
@@ -26,11 +56,10 @@ async def search_up_candidates(keyword: str, limit: int = 8) -> tuple[list[dict]
             "https://api.bilibili.com/x/web-interface/search/type",
             label=f"Bilibili UP 搜索 {keyword}",
             params={"search_type": "bili_user", "keyword": keyword, "page": 1},
-            timeout=10,
         )
         if response.status_code != 200:
             return [], f"搜索失败，HTTP {response.status_code}。"
-        data = response.json()
+        data = response_json(response)
         if data.get("code") != 0:
             return [], f"搜索失败，code={data.get('code')}。"
     except Exception as exc:
@@ -50,7 +79,14 @@ async def search_up_candidates(keyword: str, limit: int = 8) -> tuple[list[dict]
                 "follower": item.get("fans"),
             }
         )
-    return [item for item in results if item["uid"]], ""
+    candidates = [item for item in results if item["uid"]]
+    if cache_ttl_sec > 0 and candidates:
+        _search_cache[cache_key] = (time.monotonic() + cache_ttl_sec, candidates)
+        _search_cache.move_to_end(cache_key)
+        if len(_search_cache) > _SEARCH_CACHE_SIZE:
+            _search_cache.popitem(last=False)
+        candidates = [dict(item) for item in candidates]
+    return candidates, ""
 
 
 async def run_search_up(plugin, event, request: WorkflowRequest) -> WorkflowResult | str:
@@ -86,7 +122,9 @@ async def run_search_up(plugin, event, request: WorkflowRequest) -> WorkflowResu
             )],
         )
 
-    candidates, error = await search_up_candidates(keyword, limit=limit)
+    candidates, error = await search_up_candidates(
+        keyword, limit=limit, cache_ttl_sec=search_cache_ttl_sec(plugin)
+    )
     if error:
         record_resolver_event(plugin, "error", source="bili_search")
         return error
@@ -2,9 +2,10 @@ from __future__ import annotations
 
 import re
 from dataclasses import dataclass
-from difflib import SequenceMatcher
 from typing import Any
 
+from ..core.utils import text_similarity
+
 
 @dataclass(slots=True, frozen=True)
 class CandidateSelection:
@@ -54,7 +55,7 @@ def score_candidate(keyword: str, item: dict, index: int) -> float:
     elif len(name) >= 2 and name in query:
         score = 0.88
     else:
-        ratio = SequenceMatcher(None, query, name).ratio()
+        ratio = text_similarity(query, name)
         if ratio >= 0.86:
             score = 0.86
         elif ratio >= 0.76:
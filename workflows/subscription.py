@@ -1,8 +1,11 @@
 from __future__ import annotations
 
+import asyncio
+
 from ..database.db_manager import Subscription
 from .candidate_analysis import analyze_search_candidates
 from .cards import (
+    SUBSCRIPTION_CHANGE_TEMPLATE,
     candidate_list_card,
     subscription_change_card,
     subscription_confirm_card,
@@ -15,7 +18,11 @@ from .resolver_stats import record_resolver_event
 from .results import WorkflowResult
 from .runtime import event_origin
 from .selection import choose_confident_candidate, score_candidate
-from .search import search_up_candidates
+from .search import (
+    invalidate_search_cache,
+    search_cache_ttl_sec,
+    search_up_candidates,
+)
 from .utils import first_text, is_uid, normalize_sub_type
 
 
@@ -46,7 +53,9 @@ async def run_add_subscription(
     if resolved and resolved.source != "uid":
         return await build_confirm_task(plugin, event, request, resolved.as_candidate())
 
-    candidates, error = await search_up_candidates(keyword)
+    candidates, error = await search_up_candidates(
+        keyword, cache_ttl_sec=search_cache_ttl_sec(plugin)
+    )
     if error:
         record_resolver_event(plugin, "error", source="bili_search")
         return error
@@ -107,7 +116,7 @@ async def add_subscription_by_uid(plugin, event, uid: str, sub_type: str) -> Wor
     if sub_type not in {"dynamic", "live", "both"}:
         return WorkflowResult("sub_type 仅支持 dynamic、live 或 both。")
 
-    user_info = await plugin.parser.get_user_info(uid)
+    user_info = await _user_info_with_card_prewarm(plugin, uid)
     if not user_info:
         return WorkflowResult(f"无法获取 UID={uid} 的用户信息。")
 
@@ -130,6 +139,7 @@ async def add_subscription_by_uid(plugin, event, uid: str, sub_type: str) -> Wor
             enabled=True,
         )
         if plugin.db.add_subscription(sub):
+            invalidate_search_cache(uid)
             messages.append(f"已添加订阅：{user_info['username']} ({uid}) [{one_type}]")
             cards.append(subscription_change_card(
                 username=user_info["username"],
@@ -337,7 +347,7 @@ async def _remove_one(plugin, event, uid: str, sub_type: str) -> WorkflowResult:
     if not ok:
         return WorkflowResult(f"未找到订阅：UID={uid}, type={sub_type}")
 
-    user_info = await plugin.parser.get_user_info(uid) or {}
+    user_info = await _user_info_with_card_prewarm(plugin, uid) or {}
     username = (
         getattr(current, "username", "")
         or user_info.get("username")
@@ -353,6 +363,17 @@ async def _remove_one(plugin, event, uid: str, sub_type: str) -> WorkflowResult:
     return WorkflowResult(f"已删除订阅：{username} ({uid}) [{sub_type}]", [card])
 
 
+async def _user_info_with_card_prewarm(plugin, uid: str) -> dict | None:
+    renderer = getattr(plugin, "renderer", None)
+    if renderer is None:
+        return await plugin.parser.get_user_info(uid)
+    user_info, _ = await asyncio.gather(
+        plugin.parser.get_user_info(uid),
+        renderer.prewarm(SUBSCRIPTION_CHANGE_TEMPLATE),
+    )
+    return user_info
+
+
 async def _candidate_from_uid(plugin, uid: str) -> tuple[dict, str]:
     user_info = await plugin.parser.get_user_info(uid)
     if not user_info: